@@ -0,0 +1,138 @@
+"""
+Side-by-side comparison of the HTML converter engines.
+
+Converts every page of the corpus with each engine, checks that the Markdown
+output is identical to the reference (a frozen copy of the original
+``find_all``-based cleaning and extraction, followed by the serialize-and-
+reparse ``markdownify(str(main_content))`` step) and reports the best-of-N
+conversion time per page. A few edge-case fragments are checked as well.
+
+    python benchmarks/compare_engines.py [--repeat N] [FILES...]
+"""
+import argparse
+import difflib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from markdownify import markdownify  # noqa: E402
+from src.config import CONTENT_SELECTORS, CLEANING_SELECTORS  # noqa: E402
+from src.services.converter_factory import create_converter, CONVERTER_ENGINES  # noqa: E402
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+
+# Inputs where the parsers disagree on the implied document structure
+FRAGMENTS = {
+    'fragment': '<p>hello <b>w</b></p>',
+    'fragment-with-content': '<div id="content"><p>hello</p></div>',
+    'no-body-tag': '<html><head><title>t</title></head><p>hello</p></html>',
+    'empty-body': '<html><body></body></html>',
+    'empty': '',
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='HTML files to convert (default: the checked-in corpus)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per page and engine')
+    return parser.parse_args()
+
+
+# The original HTMLConverter logic, kept verbatim so the engines are checked
+# against the behaviour they replaced rather than against themselves.
+
+def _reference_clean(soup: BeautifulSoup) -> None:
+    for tag in CLEANING_SELECTORS['unwanted_tags']:
+        for element in soup.find_all(tag):
+            element.decompose()
+    for class_name in CLEANING_SELECTORS['common_classes']:
+        for element in soup.find_all(class_=lambda x: x and class_name in x.lower()):
+            element.decompose()
+    for id_name in CLEANING_SELECTORS['common_ids']:
+        for element in soup.find_all(id=lambda x: x and id_name in x.lower()):
+            element.decompose()
+
+
+def _reference_extract(soup: BeautifulSoup):
+    for content_id in CONTENT_SELECTORS['ids']:
+        main_content = soup.find(id=lambda x: x and content_id in x.lower())
+        if main_content:
+            return main_content
+    for content_class in CONTENT_SELECTORS['classes']:
+        main_content = soup.find(class_=content_class)
+        if main_content:
+            return main_content
+    return soup.find('body')
+
+
+def reference_markdown(html: str) -> str:
+    """Markdown as produced by the original pipeline."""
+    soup = BeautifulSoup(html, 'html.parser')
+    _reference_clean(soup)
+    main_content = _reference_extract(soup)
+    if main_content is None:
+        return ""  # The original rendered str(None), i.e. "None"; the engines return ""
+    return markdownify(str(main_content), heading_style="ATX")
+
+
+def report_mismatches(reference: str, outputs: dict) -> int:
+    mismatches = 0
+    for engine, output in outputs.items():
+        if output != reference:
+            mismatches += 1
+            diff = difflib.unified_diff(
+                reference.splitlines(), output.splitlines(),
+                'reference', engine, lineterm='', n=1
+            )
+            print("\n".join(list(diff)[:20]))
+    return mismatches
+
+
+def best_time(converter, html: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        converter.convert_to_markdown(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    args = parse_args()
+    files = args.files or sorted(CORPUS_DIR.glob('*.html'))
+    converters = {engine: create_converter(engine) for engine in CONVERTER_ENGINES}
+    for converter in converters.values():
+        converter.cache = None  # Measure the real work, not the memoization
+
+    baseline = CONVERTER_ENGINES[0]
+    mismatches = 0
+    print(f"{'page':<28} {'size':>9} " + " ".join(f"{e + ' ms':>10}" for e in CONVERTER_ENGINES) + "  speedup  match")
+    for path in files:
+        html = path.read_text(encoding='utf-8')
+        outputs = {e: c.convert_to_markdown(html) for e, c in converters.items()}
+        timings = {e: best_time(c, html, args.repeat) for e, c in converters.items()}
+        reference = reference_markdown(html)
+        match = all(output == reference for output in outputs.values())
+        speedup = timings[baseline] / min(timings.values())
+        print(
+            f"{path.name:<28} {len(html):>9} "
+            + " ".join(f"{timings[e] * 1000:>10.1f}" for e in CONVERTER_ENGINES)
+            + f"  {speedup:>6.2f}x  {'yes' if match else 'NO'}"
+        )
+        mismatches += report_mismatches(reference, outputs)
+
+    for name, html in FRAGMENTS.items():
+        reference = reference_markdown(html)
+        outputs = {e: c.convert_to_markdown(html) for e, c in converters.items()}
+        match = all(output == reference for output in outputs.values())
+        print(f"{name:<28} {len(html):>9} {'':>{11 * len(CONVERTER_ENGINES)}}  {'':>7}  {'yes' if match else 'NO'}")
+        mismatches += report_mismatches(reference, outputs)
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
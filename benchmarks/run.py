@@ -0,0 +1,340 @@
+"""
+Offline benchmark runner for the scraper and the converter.
+
+Starts the local corpus server (see ``server.py``), drives each fetch tier
+against it and times every converter stage on the corpus pages. Reports
+throughput, p50/p95 latency and peak Python memory (tracemalloc) and writes
+the results as JSON so runs can be compared:
+
+    python benchmarks/run.py --latency 20 --compression gzip
+    python benchmarks/run.py --baseline benchmarks/results/<earlier>.json
+
+The rendering tiers (Requests-HTML, Selenium, Playwright) need a local
+Chromium/chromedriver, so they only run when named explicitly with
+``--tiers``. tracemalloc only sees Python allocations, so memory held by
+lxml or a browser process is not part of the peak figures.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import anyio  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+from lxml import html as lxml_html  # noqa: E402
+from server import CorpusServer, CORPUS_DIR  # noqa: E402
+from src.services.converter_factory import create_converter, CONVERTER_ENGINES  # noqa: E402
+from src.services.web_scraper import WebScraper  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+DEFAULT_TIERS = ('aiohttp', 'Requests')
+ALL_TIERS = DEFAULT_TIERS + ('Requests-HTML', 'Selenium', 'Playwright')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tiers', default=','.join(DEFAULT_TIERS),
+                        help=f"Comma-separated fetch tiers out of {', '.join(ALL_TIERS)}; empty to skip")
+    parser.add_argument('--engines', default=','.join(CONVERTER_ENGINES),
+                        help='Comma-separated converter engines; empty to skip')
+    parser.add_argument('--requests', type=int, default=100, help='Requests per fetch tier')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent requests per fetch tier')
+    parser.add_argument('--repeat', type=int, default=10, help='Timed runs per page and converter stage')
+    parser.add_argument('--startup-runs', type=int, default=5,
+                        help='Cold interpreter starts to time; 0 to skip')
+    parser.add_argument('--latency', type=float, default=20.0, help='Server delay per response in ms')
+    parser.add_argument('--jitter', type=float, default=10.0, help='Random extra server delay in ms')
+    parser.add_argument('--compression', default='gzip', choices=['gzip', 'deflate', 'br', 'zstd', 'identity'])
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Share of requests the server fails')
+    parser.add_argument('--failure-mode', default='error', choices=['error', 'throttle', 'stall'])
+    parser.add_argument('--output', type=Path, default=RESULTS_DIR, help='Directory for the JSON results')
+    parser.add_argument('--baseline', type=Path, help='Earlier results file to compare against')
+    return parser.parse_args()
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(samples: List[float], elapsed: float, peak_bytes: int, **extra) -> Dict[str, float]:
+    return {
+        'samples': len(samples),
+        'throughput': round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+        'peak_memory_kb': round(peak_bytes / 1024, 1),
+        **extra
+    }
+
+
+def measure_peak(func: Callable[[], object]) -> int:
+    """Peak traced allocation of a single call, measured apart from the timed runs."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+# --- cold start ----------------------------------------------------------------
+
+STARTUP_SCRIPT = '''
+import time
+started = time.perf_counter()
+from src.services.web_scraper import WebScraper
+from src.services.converter_factory import create_converter
+scraper, converter = WebScraper(), create_converter()
+print(time.perf_counter() - started)
+'''
+
+
+def bench_startup(runs: int) -> Dict:
+    """Import and construct the scraper and converter in fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return summarize(samples, sum(samples), 0)
+
+
+# --- converter stages -------------------------------------------------------
+
+def converter_stages(engine: str, converter) -> Dict[str, Callable]:
+    """Per-stage callables; each takes the previous stage's output."""
+    if engine == 'lxml':
+        def parse(html):
+            return lxml_html.document_fromstring(html)
+
+        def emit(main):
+            return converter.emitter.emit_lxml(main)
+    else:
+        def parse(html):
+            return BeautifulSoup(html, 'html.parser')
+
+        def emit(main):
+            return converter.emitter.emit(main)
+
+    def clean(root):
+        converter._clean_content(root)
+        return root
+
+    return {
+        'parse': parse,
+        'clean': clean,
+        'extract': converter._extract_main_content,
+        'markdown': emit
+    }
+
+
+def bench_converter(engine: str, pages: Dict[str, str], repeat: int) -> Dict[str, Dict]:
+    converter = create_converter(engine)
+    converter.cache = None  # Measure the real work, not the memoization
+    stages = converter_stages(engine, converter)
+    samples = {name: [] for name in list(stages) + ['total']}
+    elapsed = dict.fromkeys(samples, 0.0)
+    for html in pages.values():
+        for _ in range(repeat):
+            value = html
+            total = 0.0
+            for name, stage in stages.items():
+                started = time.perf_counter()
+                value = stage(value)
+                took = time.perf_counter() - started
+                samples[name].append(took)
+                elapsed[name] += took
+                total += took
+            samples['total'].append(total)
+            elapsed['total'] += total
+
+    def run_stages_to(last: str) -> Callable[[], None]:
+        def run():
+            for html in pages.values():
+                value = html
+                for name, stage in stages.items():
+                    value = stage(value)
+                    if name == last:
+                        break
+        return run
+
+    results = {}
+    previous_peak = 0
+    for name in stages:
+        # Peak of running the pipeline up to this stage; the stage's own share
+        # is the growth over the previous stage.
+        peak = measure_peak(run_stages_to(name))
+        results[name] = summarize(samples[name], elapsed[name], max(peak - previous_peak, 0))
+        previous_peak = max(previous_peak, peak)
+    results['total'] = summarize(samples['total'], elapsed['total'], previous_peak)
+    converter.close()
+    return results
+
+
+# --- fetch tiers --------------------------------------------------------------
+
+async def bench_tier(method: Callable, urls: List[str], concurrency: int, timeout: float) -> Dict:
+    limiter = anyio.CapacityLimiter(concurrency)
+
+    async def fetch(url: str, latencies: List[float], failures: List[str]) -> None:
+        async with limiter:
+            started = time.perf_counter()
+            try:
+                with anyio.fail_after(timeout):
+                    result = await method(url)
+                ok = result.ok
+            except Exception:
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                failures.append(url)
+
+    async def fetch_all(batch: List[str], latencies: List[float], failures: List[str]) -> None:
+        async with anyio.create_task_group() as tg:
+            for url in batch:
+                tg.start_soon(fetch, url, latencies, failures)
+
+    latencies: List[float] = []
+    failures: List[str] = []
+    started = time.perf_counter()
+    await fetch_all(urls, latencies, failures)
+    elapsed = time.perf_counter() - started
+
+    # Peak memory from a short traced pass, so tracing doesn't skew the timings
+    tracemalloc.start()
+    try:
+        await fetch_all([url + '&traced=1' for url in urls[:concurrency]], [], [])
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return summarize(latencies, elapsed, peak, failures=len(failures))
+
+
+async def bench_fetch(args, tiers: List[str]) -> Dict[str, Dict]:
+    server = CorpusServer(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        compression=args.compression,
+        failure_rate=args.failure_rate,
+        failure_mode=args.failure_mode,
+        seed=0
+    )
+    base_url = await server.start()
+    scraper = WebScraper()
+    # Benchmark the tiers themselves: no learned ordering, no response caches
+    scraper.strategy_store = None
+    scraper.http_cache = None
+    results = {}
+    try:
+        methods = {name: (method, timeout) for method, name, timeout in scraper._fetch_tiers(base_url)}
+        for tier in tiers:
+            method, timeout = methods[tier]
+            urls = [
+                f"{base_url}/{server.pages[i % len(server.pages)]}?tier={tier}&copy={i}"
+                for i in range(args.requests)
+            ]
+            results[tier] = await bench_tier(method, urls, args.concurrency, timeout)
+            print_row(tier, results[tier], failures=True)
+    finally:
+        await scraper.close()
+        await server.stop()
+    return results
+
+
+# --- reporting ------------------------------------------------------------------
+
+def print_header(title: str, failures: bool = False) -> None:
+    print(f"\n{title:<28} {'n':>6} {'per s':>9} {'p50 ms':>9} {'p95 ms':>9} {'peak KB':>10}"
+          + (f" {'failed':>7}" if failures else ""))
+
+
+def print_row(name: str, row: Dict, failures: bool = False) -> None:
+    print(f"{name:<28} {row['samples']:>6} {row['throughput']:>9.1f} {row['p50_ms']:>9.2f} "
+          f"{row['p95_ms']:>9.2f} {row['peak_memory_kb']:>10.1f}"
+          + (f" {row.get('failures', 0):>7}" if failures else ""))
+
+
+def compare(results: Dict, baseline: Dict) -> None:
+    """Print the p50 change of every measurement present in both runs."""
+    print(f"\nChange in p50 against {baseline.get('timestamp', 'baseline')}:")
+
+    def walk(current, previous, path):
+        for key, value in current.items():
+            if key not in previous:
+                continue
+            if isinstance(value, dict) and 'p50_ms' in value:
+                before, after = previous[key]['p50_ms'], value['p50_ms']
+                change = (after - before) / before * 100 if before else 0.0
+                print(f"  {'/'.join(path + [key]):<40} {before:>9.2f} -> {after:>9.2f} ms  {change:+6.1f}%")
+            elif isinstance(value, dict):
+                walk(value, previous[key], path + [key])
+
+    sections = ('startup', 'fetch', 'convert')
+    walk({key: results[key] for key in sections}, {key: baseline.get(key, {}) for key in sections}, [])
+
+
+def main() -> int:
+    args = parse_args()
+    tiers = [t for t in args.tiers.split(',') if t]
+    engines = [e for e in args.engines.split(',') if e]
+    for tier in tiers:
+        if tier not in ALL_TIERS:
+            sys.exit(f"Unknown tier {tier!r}; choose from {', '.join(ALL_TIERS)}")
+    for engine in engines:
+        if engine not in CONVERTER_ENGINES:
+            sys.exit(f"Unknown engine {engine!r}; choose from {', '.join(CONVERTER_ENGINES)}")
+
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        'startup': {},
+        'fetch': {},
+        'convert': {}
+    }
+
+    if args.startup_runs:
+        print_header('cold start')
+        results['startup'] = bench_startup(args.startup_runs)
+        print_row('import + construct', results['startup'])
+
+    if tiers:
+        print_header('fetch tier', failures=True)
+        results['fetch'] = asyncio.run(bench_fetch(args, tiers))
+
+    pages = {path.name: path.read_text(encoding='utf-8') for path in sorted(CORPUS_DIR.glob('*.html'))}
+    for engine in engines:
+        print_header(f'{engine} converter stage')
+        results['convert'][engine] = bench_converter(engine, pages, args.repeat)
+        for stage, row in results['convert'][engine].items():
+            print_row(stage, row)
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    path = args.output / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"\nResults written to {path}")
+
+    if args.baseline:
+        compare(results, json.loads(args.baseline.read_text(encoding='utf-8')))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
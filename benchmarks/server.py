@@ -0,0 +1,188 @@
+"""
+Local HTTP stand-in that serves the benchmark corpus.
+
+Every corpus page is available as ``/<name>.html``; any query string is
+ignored, so ``/blog_post.html?copy=7`` yields unique URLs for the same page.
+Latency, compression and failures can be configured for the whole server
+or per request with the ``latency`` (ms), ``encoding`` and ``fail`` query
+parameters. Responses carry ETag/Last-Modified and honour If-None-Match.
+
+    python benchmarks/server.py --port 8080 --latency 50 --failure-rate 0.05
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import random
+import socket
+import zlib
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, Optional
+
+from aiohttp import web
+
+try:
+    import brotli
+except ImportError:  # br is only offered when brotli is installed
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstd is only offered when zstandard is installed
+    zstandard = None
+
+CORPUS_DIR = Path(__file__).resolve().parent / 'corpus'
+FAILURE_MODES = ('error', 'throttle', 'stall')
+LAST_MODIFIED = formatdate(1704067200, usegmt=True)  # 2024-01-01, fixed for revalidation
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == 'gzip':
+        return gzip.compress(body)
+    if encoding == 'deflate':
+        return zlib.compress(body)
+    if encoding == 'br':
+        return brotli.compress(body)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor().compress(body)
+    return body
+
+
+class CorpusServer:
+    def __init__(self,
+                 corpus_dir: Path = CORPUS_DIR,
+                 latency: float = 0.0,
+                 jitter: float = 0.0,
+                 compression: str = 'gzip',
+                 failure_rate: float = 0.0,
+                 failure_mode: str = 'error',
+                 seed: Optional[int] = None) -> None:
+        """
+        Args:
+            latency: Delay before each response, in seconds
+            jitter: Uniform random extra delay, in seconds
+            compression: 'gzip', 'deflate', 'br', 'zstd' or 'identity'
+            failure_rate: Probability that a request fails
+            failure_mode: 'error' (500), 'throttle' (429 with Retry-After)
+                or 'stall' (never answers)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.compression = compression
+        self.failure_rate = failure_rate
+        self.failure_mode = failure_mode
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._pages: Dict[str, bytes] = {
+            path.name: path.read_bytes() for path in sorted(corpus_dir.glob('*.html'))
+        }
+        self._encoded: Dict[tuple, bytes] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ''
+
+    @property
+    def pages(self):
+        return list(self._pages)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Start serving; returns the base URL (port 0 picks a free port)."""
+        app = web.Application()
+        app.router.add_get('/{name}', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        await web.SockSite(self._runner, sock).start()
+        self.base_url = f"http://{host}:{sock.getsockname()[1]}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'CorpusServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests_served += 1
+        body = self._pages.get(request.match_info['name'])
+        if body is None:
+            raise web.HTTPNotFound()
+
+        latency = float(request.query['latency']) / 1000 if 'latency' in request.query else self.latency
+        await asyncio.sleep(latency + self._random.uniform(0, self.jitter))
+
+        fail = request.query.get('fail')
+        if fail or (self.failure_rate and self._random.random() < self.failure_rate):
+            mode = fail if fail in FAILURE_MODES else self.failure_mode
+            if mode == 'throttle':
+                return web.Response(status=429, headers={'Retry-After': '1'}, text='Too Many Requests')
+            if mode == 'stall':
+                await asyncio.sleep(3600)
+            return web.Response(status=500, text='Injected failure')
+
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        headers = {
+            'Content-Type': 'text/html; charset=utf-8',
+            'ETag': etag,
+            'Last-Modified': LAST_MODIFIED,
+            'Cache-Control': 'no-cache'
+        }
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+
+        encoding = request.query.get('encoding', self.compression)
+        accepted = request.headers.get('Accept-Encoding', '')
+        unavailable = (encoding == 'br' and brotli is None) or (encoding == 'zstd' and zstandard is None)
+        if encoding == 'identity' or encoding not in accepted or unavailable:
+            encoding = 'identity'
+        else:
+            headers['Content-Encoding'] = encoding
+        key = (request.match_info['name'], encoding)
+        if key not in self._encoded:
+            self._encoded[key] = _compress(body, encoding)
+        return web.Response(body=self._encoded[key], headers=headers)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='Delay per response in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra delay in ms')
+    parser.add_argument('--compression', default='gzip', choices=['gzip', 'deflate', 'br', 'zstd', 'identity'])
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--failure-mode', default='error', choices=FAILURE_MODES)
+    return parser.parse_args()
+
+
+async def serve_forever(args) -> None:
+    server = CorpusServer(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        compression=args.compression,
+        failure_rate=args.failure_rate,
+        failure_mode=args.failure_mode
+    )
+    base_url = await server.start(args.host, args.port)
+    print(f"Serving {len(server.pages)} corpus pages at {base_url}/")
+    for page in server.pages:
+        print(f"  {base_url}/{page}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(serve_forever(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,206 @@
+import time
+_process_started = time.perf_counter()  # Before the heavy imports, for the startup measurement
+
+import argparse  # noqa: E402
+import multiprocessing  # noqa: E402
+import os  # noqa: E402
+import sys  # noqa: E402
+from contextlib import asynccontextmanager  # noqa: E402
+
+import anyio  # noqa: E402
+
+from src.config import (  # noqa: E402
+    BATCH_SETTINGS, FETCH_STRATEGY, CONVERSION_CACHE_SETTINGS, CONVERTER_SETTINGS, SCHEDULER_SETTINGS,
+    CRAWLER_SETTINGS
+)
+from src.services.batch_converter import BatchConverter, BatchReport, read_urls  # noqa: E402
+from src.services.crawler import Crawler  # noqa: E402
+from src.services.crawl_manifest import CrawlManifest  # noqa: E402
+from src.services.web_scraper import WebScraper  # noqa: E402
+from src.services.converter_factory import create_converter, CONVERTER_ENGINES  # noqa: E402
+from src.services.file_storage import FileStorage  # noqa: E402
+from src.services.conversion_cache import ConversionCache  # noqa: E402
+from src.services.metrics import MetricsRegistry  # noqa: E402
+from src.services.logger import LoggerService  # noqa: E402
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert URLs to Markdown without a GUI.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    # Options shared by every subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-c', '--concurrency', type=int, default=BATCH_SETTINGS['concurrency'],
+                        help='Maximum number of URLs processed at once')
+    common.add_argument('--per-host-concurrency', type=int, default=SCHEDULER_SETTINGS['per_host_concurrency'],
+                        help='Maximum number of fetches in flight to one host')
+    common.add_argument('--per-host-rate', type=positive_float, default=SCHEDULER_SETTINGS['per_host_rate'],
+                        help='Requests per second allowed to one host (after a burst)')
+    output = common.add_mutually_exclusive_group()
+    output.add_argument('-o', '--output-dir', default=BATCH_SETTINGS['output_dir'],
+                        help='Directory receiving one Markdown file per URL')
+    output.add_argument('--jsonl',
+                        help='Write one JSON record per URL to this file (- for stdout)')
+    common.add_argument('--fetch-mode', choices=['sequential', 'hedged'], default=FETCH_STRATEGY['mode'],
+                        help='Try fetch tiers one after another, or race them with a delay')
+    common.add_argument('--hedge-delay', type=float, default=FETCH_STRATEGY['hedge_delay'],
+                        help='Seconds before the next tier starts in hedged mode')
+    common.add_argument('--engine', choices=CONVERTER_ENGINES, default=CONVERTER_SETTINGS['engine'],
+                        help='HTML parsing engine used for conversion')
+    common.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for HTML to Markdown conversion (0 = use a thread)')
+    common.add_argument('--conversion-cache', default=CONVERSION_CACHE_SETTINGS['path'],
+                        help='SQLite file that keeps converted Markdown between runs')
+    common.add_argument('--manifest', metavar='PATH',
+                        help='JSON manifest of earlier runs; unchanged pages are not converted again')
+    common.add_argument('--sitemap', metavar='URL',
+                        help='sitemap.xml whose <lastmod> lets unchanged pages skip the fetch (with --manifest)')
+    common.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print the summary, not per-URL latencies')
+    common.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Log file level (default from LOGGING_SETTINGS or URL_MARKDOWN_LOG_LEVEL)')
+    common.add_argument('--metrics-out',
+                        help='Write per-stage timings and cache/tier counters to this file')
+    common.add_argument('--metrics-format', choices=['json', 'prometheus'], default='json',
+                        help='Format of the --metrics-out file')
+
+    batch = subparsers.add_parser('batch', parents=[common], help='Convert a list of URLs')
+    batch.add_argument('input', nargs='?', default='-',
+                       help='File with one URL per line, or - for stdin (default)')
+
+    crawl = subparsers.add_parser('crawl', parents=[common],
+                                  help='Convert a site by following its links from seed URLs')
+    crawl.add_argument('seeds', nargs='+', help='URLs the crawl starts from; their sites bound it')
+    crawl.add_argument('-d', '--max-depth', type=int, default=CRAWLER_SETTINGS['max_depth'],
+                       help='Link hops followed from the seeds')
+    crawl.add_argument('--max-pages', type=int, default=CRAWLER_SETTINGS['max_pages'],
+                       help='Stop queueing new URLs after this many')
+    crawl.add_argument('--include', action='append', default=[], metavar='REGEX',
+                       help='Only follow URLs matching this pattern (repeatable)')
+    crawl.add_argument('--exclude', action='append', default=[], metavar='REGEX',
+                       help='Never follow URLs matching this pattern (repeatable)')
+    return parser.parse_args(argv)
+
+
+@asynccontextmanager
+async def setup_services(args):
+    scraper = WebScraper(
+        fetch_mode=args.fetch_mode,
+        hedge_delay=args.hedge_delay,
+        # A streamed lxml tree is only useful when converting in this process
+        parse_documents=args.engine == 'lxml' and args.workers == 0
+    )
+    cache = ConversionCache(path=args.conversion_cache) if CONVERSION_CACHE_SETTINGS['enabled'] else None
+    converter = create_converter(args.engine, cache, processes=args.workers)
+    storage = FileStorage()
+    try:
+        yield scraper, converter, storage
+    finally:
+        await scraper.close()
+        converter.close()
+
+
+def print_report(report: BatchReport, quiet: bool, stream=sys.stderr):
+    if not quiet:
+        for item in sorted(report.items, key=lambda i: i.latency, reverse=True):
+            status = "same" if item.unchanged else "ok  " if item.ok else "FAIL"
+            print(f"{status} {item.latency * 1000:9.1f} ms  {item.tier or '-':<13} {item.url}", file=stream)
+    print(
+        f"\n{len(report.items)} URLs in {report.elapsed:.2f}s "
+        f"({report.throughput:.2f} URLs/s): {report.succeeded} ok ({report.unchanged} unchanged), "
+        f"{report.failed} failed",
+        file=stream
+    )
+    print(
+        f"latency p50 {report.percentile(50) * 1000:.1f} ms, "
+        f"p95 {report.percentile(95) * 1000:.1f} ms, "
+        f"max {report.percentile(100) * 1000:.1f} ms",
+        file=stream
+    )
+
+
+async def run_batch(args) -> int:
+    if args.log_level:
+        LoggerService().set_level(args.log_level)
+    if args.command == 'crawl':
+        urls = args.seeds
+    elif args.input == '-':
+        urls = read_urls(sys.stdin)
+    else:
+        with open(args.input, encoding='utf-8') as f:
+            urls = read_urls(f)
+
+    jsonl_stream = None
+    if args.jsonl == '-':
+        jsonl_stream = sys.stdout
+    elif args.jsonl:
+        jsonl_stream = open(args.jsonl, 'w', encoding='utf-8')
+
+    try:
+        async with setup_services(args) as (scraper, converter, storage):
+            startup = time.perf_counter() - _process_started
+            MetricsRegistry().observe('startup_seconds', startup, entrypoint='cli')
+            LoggerService().info("Services ready in %.3fs", startup)
+            options = dict(
+                concurrency=args.concurrency,
+                output_dir=args.output_dir,
+                jsonl_stream=jsonl_stream,
+                per_host_concurrency=args.per_host_concurrency,
+                per_host_rate=args.per_host_rate,
+                manifest=CrawlManifest(args.manifest) if args.manifest else None,
+                sitemap=args.sitemap
+            )
+            if args.command == 'crawl':
+                batch = Crawler(
+                    scraper, converter, storage,
+                    max_depth=args.max_depth,
+                    max_pages=args.max_pages,
+                    include=args.include,
+                    exclude=args.exclude,
+                    **options
+                )
+            else:
+                batch = BatchConverter(scraper, converter, storage, **options)
+            report = await batch.run(urls)
+            cache_stats = scraper.http_cache.stats() if scraper.http_cache else None
+    finally:
+        if jsonl_stream is not None and jsonl_stream is not sys.stdout:
+            jsonl_stream.close()
+
+    print_report(report, args.quiet)
+    if cache_stats is not None:
+        print(
+            f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['revalidations']} revalidations",
+            file=sys.stderr
+        )
+    if args.metrics_out:
+        MetricsRegistry().export(args.metrics_out, args.metrics_format)
+    return 0 if report.failed == 0 else 1
+
+
+def backend_options() -> dict:
+    """Run on uvloop when it is installed (it isn't available on Windows)."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {'use_uvloop': True}
+
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = parse_args(argv)
+    if args.command in ('batch', 'crawl'):
+        sys.exit(anyio.run(run_batch, args, backend="asyncio", backend_options=backend_options()))
+
+
+if __name__ == "__main__":
+    main()
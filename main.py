@@ -1,52 +1,58 @@
-import re
-import sys
-import os
-import atexit
-import asyncio
-import anyio
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
-from contextlib import asynccontextmanager
-from src.services.web_scraper import WebScraper
-from src.services.html_converter import HTMLConverter
-from src.services.file_storage import FileStorage
-from src.ui.main_window import MarkdownViewer
+import time
+_process_started = time.perf_counter()  # Before the heavy imports, for the startup measurement
 
-def slugify(text):
-    """
-    Convert text to a slug format.
-    """
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)  # Remove non-alphanumeric characters
-    text = re.sub(r'\s+', '-', text).strip('-')  # Replace spaces with dashes
-    return text
+import sys  # noqa: E402
+import os  # noqa: E402
+import multiprocessing  # noqa: E402
+import atexit  # noqa: E402
+import asyncio  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+from qasync import QEventLoop  # noqa: E402
+from contextlib import asynccontextmanager  # noqa: E402
+from src.services.web_scraper import WebScraper  # noqa: E402
+from src.services.converter_factory import create_converter  # noqa: E402
+from src.config import CONVERSION_POOL_SETTINGS  # noqa: E402
+from src.services.file_storage import FileStorage  # noqa: E402
+from src.ui.main_window import MarkdownViewer  # noqa: E402
+from src.services.logger import LoggerService  # noqa: E402
+from src.services.metrics import MetricsRegistry  # noqa: E402
 
 @asynccontextmanager
 async def setup_services():
     scraper = WebScraper()
-    converter = HTMLConverter()
+    converter = create_converter(processes=CONVERSION_POOL_SETTINGS['processes'])
     storage = FileStorage()
     try:
         yield scraper, converter, storage
     finally:
         # Cleanup
         await scraper.close()
+        converter.close()
 
 async def run_app(app: QApplication):
+    # Qt drives the event loop; this coroutine just waits for the window to close.
+    # Qt isn't allowed to quit by itself, so the loop keeps running for the cleanup.
+    app.setQuitOnLastWindowClosed(False)
+    app_closed = asyncio.Event()
+    app.lastWindowClosed.connect(app_closed.set)
     async with setup_services() as (scraper, converter, storage):
         viewer = MarkdownViewer(scraper, converter, storage)
         viewer.show()
-        
-        while not viewer.isHidden():
-            app.processEvents()
-            await asyncio.sleep(0.01)
+        startup = time.perf_counter() - _process_started
+        MetricsRegistry().observe('startup_seconds', startup, entrypoint='gui')
+        LoggerService().info("Application started in %.3fs", startup)
+        await app_closed.wait()
 
 def main():
+    multiprocessing.freeze_support()
     # Suppress OpenType support warnings
     os.environ["QT_LOGGING_RULES"] = "qt.fonts.warning=false"
     
     app = QApplication(sys.argv)
-    anyio.run(lambda: run_app(app), backend="asyncio")
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        loop.run_until_complete(run_app(app))
 
 @atexit.register
 def cleanup():
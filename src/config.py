@@ -30,4 +30,146 @@ CLEANING_SELECTORS = {
     'common_ids': [
         'tutorialmodal-root'
     ]
-}
\ No newline at end of file
+}
+
+BATCH_SETTINGS = {
+    'concurrency': 8,
+    'output_dir': 'output'
+}
+
+HTTP_SETTINGS = {
+    'timeout': 10,
+    'connection_limit': 100,
+    'connection_limit_per_host': 10,
+    'keepalive_timeout': 30,
+    'dns_cache_ttl': 300
+}
+
+PLAYWRIGHT_POOL_SETTINGS = {
+    'browsers': 2,
+    'max_pages_per_browser': 4,
+    'restart_after_pages': 200,
+    'memory_limit_mb': 1536,
+    'launch_args': ['--no-sandbox', '--disable-dev-shm-usage']
+}
+
+SELENIUM_POOL_SETTINGS = {
+    'drivers': 2,
+    'page_load_strategy': 'eager',
+    'page_load_timeout': 20,
+    'restart_after_pages': 100,
+    'block_images': True,
+    'blocked_url_patterns': [
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+        '*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m4a'
+    ]
+}
+
+FETCH_STRATEGY = {
+    'mode': 'sequential',  # 'sequential' or 'hedged'
+    'hedge_delay': 2.0  # seconds before the next tier is started in hedged mode
+}
+
+STRATEGY_STORE_SETTINGS = {
+    'enabled': True,
+    'path': 'cache/fetch_strategy.json',
+    'min_attempts': 3,  # observations before a tier's record is trusted
+    'skip_below_success_rate': 0.2,
+    'reprobe_probability': 0.05,
+    'smoothing': 0.3,  # weight of the newest observation in the moving averages
+    'save_every': 20  # records between automatic saves
+}
+
+HTTP_CACHE_SETTINGS = {
+    'enabled': True,
+    'path': 'cache/http_cache.sqlite3',
+    'default_ttl': 0,  # seconds a response without Cache-Control/Expires stays fresh
+    'max_bytes': 512 * 1024 * 1024,  # oldest entries are evicted beyond this total body size
+    'max_entry_age': 30 * 24 * 3600,  # entries not stored or revalidated for this long are evicted
+    'evict_every': 100  # writes between eviction passes
+}
+
+CONVERSION_CACHE_SETTINGS = {
+    'enabled': True,
+    'max_entries': 256,  # in-memory LRU size
+    'path': None  # e.g. 'cache/conversions.sqlite3' to also keep results on disk
+}
+
+CONVERTER_SETTINGS = {
+    'engine': 'bs4'  # 'bs4' (BeautifulSoup html.parser) or 'lxml'
+}
+
+STREAMING_SETTINGS = {
+    'chunk_size': 64 * 1024,
+    'max_document_bytes': 10 * 1024 * 1024,  # bodies are cut off beyond this size
+    'incremental_parse': False  # build an lxml tree while downloading (used by the lxml engine)
+}
+
+CONVERSION_POOL_SETTINGS = {
+    'processes': 2  # worker processes for HTML to Markdown; 0 converts in a thread instead
+}
+
+METRICS_SETTINGS = {
+    'enabled': True,
+    'namespace': 'url_markdown',  # prefix of the exported Prometheus metric names
+    'reservoir_size': 1024  # recent samples kept per timing for the quantiles
+}
+
+LOGGING_SETTINGS = {
+    'level': 'INFO',  # overridden by the URL_MARKDOWN_LOG_LEVEL environment variable
+    'directory': 'logs',
+    'filename': 'url_markdown.log',
+    'observer_queue_size': 1000  # messages for the UI beyond this backlog are dropped
+}
+
+LOG_WIDGET_SETTINGS = {
+    'max_lines': 5000,  # older lines are dropped from the log view
+    'flush_interval_ms': 50  # buffered messages are appended at most this often
+}
+
+PREVIEW_SETTINGS = {
+    'max_html_chars': 200_000,  # larger pages are previewed truncated until loaded on demand
+    'max_markdown_chars': 1_000_000,  # same for the Markdown view
+    'chunk_chars': 64 * 1024,  # Markdown is laid out this much per event loop turn
+}
+
+USER_AGENT_SETTINGS = {
+    'path': 'cache/user_agents.json',  # local cache of agents, refreshed in the background
+    'rotation': 'request',  # 'request' picks the next agent per request, 'domain' keeps one per domain
+    'pool_size': 50,
+    'max_age': 7 * 24 * 3600,  # seconds before the cached agents are refreshed
+    'api_agents': 5,  # agents fetched from the user agent API per refresh, when an API key is set
+    'api_timeout': 5,
+    'api_cache_ttl': 3600
+}
+
+DECODING_SETTINGS = {
+    'sniff_bytes': 4096,  # <meta charset> is looked for in this many leading bytes
+    'detect_bytes': 64 * 1024,  # sample size for statistical detection of undeclared charsets
+    'fallback_encoding': 'windows-1252'
+}
+
+SCHEDULER_SETTINGS = {
+    'max_concurrency': 16,  # fetches in flight across all hosts
+    'per_host_concurrency': 4,
+    'per_host_rate': 4.0,  # requests per second each host's token bucket refills
+    'per_host_burst': 8,  # bucket size: requests a host may get back to back
+    'max_retries': 3,  # attempts after a 429/503 before giving up on a URL
+    'backoff_base': 1.0,  # seconds of the first backoff when no Retry-After is sent, doubling per retry
+    'backoff_max': 120.0  # cap for both computed and server-requested backoff
+}
+
+CRAWLER_SETTINGS = {
+    'max_depth': 3,  # link hops from the seed URLs
+    'max_pages': 10_000,  # URLs queued per crawl, seeds included
+    'skip_extensions': [  # links to these files are never fetched
+        '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico', '.pdf', '.zip', '.gz', '.tar',
+        '.css', '.js', '.json', '.xml', '.txt', '.mp4', '.webm', '.mp3', '.woff', '.woff2'
+    ],
+    'ignored_query_params': ['utm_*', 'gclid', 'fbclid', 'ref']  # dropped when canonicalizing links
+}
+
+INCREMENTAL_SETTINGS = {
+    'save_every': 500,  # manifest updates between automatic saves
+    'max_sitemaps': 50  # sitemap files read per run, following sitemap indexes
+}
@@ -1,7 +1,19 @@
-
 from abc import ABC, abstractmethod
+from typing import Any, Optional
 
 class IConverter(ABC):
     @abstractmethod
-    def convert_to_markdown(self, html_content: str) -> str:
-        pass
\ No newline at end of file
+    def convert_to_markdown(self, html_content: str, document: Optional[Any] = None) -> str:
+        """
+        Convert HTML to Markdown.
+
+        Args:
+            html_content: The page HTML
+            document: Optional tree already parsed from ``html_content``;
+                converters that can use it skip parsing
+        """
+        pass
+
+    async def convert_to_markdown_async(self, html_content: str, document: Optional[Any] = None) -> str:
+        """Awaitable variant of convert_to_markdown"""
+        return self.convert_to_markdown(html_content, document)
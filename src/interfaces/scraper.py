@@ -1,8 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class FetchResult:
+    """Content fetched for a URL plus how it was obtained."""
+    url: str
+    content: str = ""
+    title: str = ""
+    tier: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)  # tier name -> seconds run
+    document: Optional[Any] = None  # lxml tree parsed while streaming, if any
+    truncated: bool = False  # body was cut off at the size budget
+    status: Optional[int] = None  # HTTP status when the server answered with an error
+    retry_after: Optional[float] = None  # seconds the server asked us to wait
+    validators: Dict[str, str] = field(default_factory=dict)  # etag / last-modified of the response
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.content)
+
+    @property
+    def http_error(self) -> bool:
+        """The server answered with a 4xx/5xx status instead of content."""
+        return self.status is not None and self.status >= 400 and not self.ok
+
+    @property
+    def throttled(self) -> bool:
+        """The server rate-limited the request; other tiers would be refused too."""
+        return self.status in (429, 503) and not self.ok
+
+    def adopt(self, other: 'FetchResult', tier: str) -> None:
+        """Take over the content fetched by ``tier``."""
+        self.content, self.title = other.content, other.title
+        self.document, self.truncated = other.document, other.truncated
+        self.validators = other.validators
+        self.tier = tier
+
 
 class IScraper(ABC):
     @abstractmethod
     async def fetch_content(self, url: str) -> Tuple[str, str]:
         """Returns tuple of (content, title)"""
-        pass
\ No newline at end of file
+        pass
+
+    async def fetch_detailed(self, url: str) -> FetchResult:
+        """Returns a FetchResult describing the fetch"""
+        content, title = await self.fetch_content(url)
+        return FetchResult(url, content, title)
@@ -0,0 +1,270 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TextIO
+from urllib.parse import urlparse
+
+import anyio
+
+from ..interfaces.converter import IConverter
+from ..interfaces.scraper import FetchResult, IScraper
+from ..interfaces.storage import IStorage
+from ..config import BATCH_SETTINGS, SCHEDULER_SETTINGS
+from ..utils import slugify
+from .crawl_manifest import CrawlManifest, ManifestEntry, content_hash
+from .fetch_scheduler import FetchScheduler
+from .logger import LoggerService
+from .sitemap import load_sitemap
+from .url_utils import normalize_url
+
+
+@dataclass
+class BatchItem:
+    """Outcome of converting a single URL."""
+    url: str
+    ok: bool
+    latency: float  # seconds from queueing the URL to its output, including scheduler waits
+    title: str = ""
+    tier: Optional[str] = None
+    output: Optional[str] = None
+    error: Optional[str] = None
+    unchanged: bool = False  # skipped because the manifest shows the same content
+
+
+@dataclass
+class BatchReport:
+    """Aggregated results of a batch run."""
+    items: List[BatchItem] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for item in self.items if item.ok)
+
+    @property
+    def unchanged(self) -> int:
+        return sum(1 for item in self.items if item.unchanged)
+
+    @property
+    def failed(self) -> int:
+        return len(self.items) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """URLs processed per second over the whole run."""
+        return len(self.items) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Return the latency (seconds) at the given percentile (0-100)."""
+        latencies = sorted(item.latency for item in self.items)
+        if not latencies:
+            return 0.0
+        index = min(len(latencies) - 1, max(0, round(pct / 100 * len(latencies)) - 1))
+        return latencies[index]
+
+
+def read_urls(stream: TextIO) -> List[str]:
+    """Read URLs from a text stream, one per line, ignoring blanks and # comments."""
+    urls = []
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            urls.append(line)
+    return urls
+
+
+class BatchConverter:
+    """
+    Drives the scraper, converter and storage services over many URLs
+    concurrently, without any Qt dependency.
+
+    Output is either one Markdown file per URL in ``output_dir`` or one JSON
+    record per URL appended to ``jsonl_stream``. Fetches go through a
+    FetchScheduler, so URLs on a slow or rate-limited host wait without
+    holding up the others.
+
+    With a ``manifest`` the run is incremental: URLs whose sitemap
+    ``<lastmod>`` is not newer than at their last conversion aren't fetched,
+    and pages whose HTML hashes the same as last time aren't converted or
+    written again (in JSONL mode they get no record).
+    """
+
+    def __init__(self,
+                 scraper: IScraper,
+                 converter: IConverter,
+                 storage: IStorage,
+                 concurrency: int = BATCH_SETTINGS['concurrency'],
+                 output_dir: str = BATCH_SETTINGS['output_dir'],
+                 jsonl_stream: Optional[TextIO] = None,
+                 per_host_concurrency: int = SCHEDULER_SETTINGS['per_host_concurrency'],
+                 per_host_rate: float = SCHEDULER_SETTINGS['per_host_rate'],
+                 manifest: Optional[CrawlManifest] = None,
+                 sitemap: Optional[str] = None) -> None:
+        self.scraper = scraper
+        self.converter = converter
+        self.storage = storage
+        self.concurrency = max(1, concurrency)
+        self.output_dir = output_dir
+        self.jsonl_stream = jsonl_stream
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.manifest = manifest
+        self.sitemap = sitemap
+        self.lastmods: Dict[str, Optional[float]] = {}  # normalized URL -> sitemap lastmod
+        self.logger = LoggerService()
+        self._used_names: set[str] = set()
+
+    async def run(self, urls: Iterable[str]) -> BatchReport:
+        """Convert every URL, fetching and converting at most ``concurrency`` at a time."""
+        urls = list(urls)
+        report = BatchReport()
+        self._prepare_output()
+
+        self.logger.info("Starting batch of %s URLs with concurrency %s", len(urls), self.concurrency)
+        scheduler = self._create_scheduler()
+        limiter = anyio.CapacityLimiter(self.concurrency)
+        started = time.perf_counter()
+
+        async def worker(url: str) -> None:
+            report.items.append(await self._process(url, scheduler, limiter))
+
+        async with scheduler, anyio.create_task_group() as tg:
+            await self._load_sitemap(scheduler)
+            for url in urls:
+                tg.start_soon(worker, url)
+
+        report.elapsed = time.perf_counter() - started
+        self._finish()
+        self.logger.info(
+            "Batch finished: %s succeeded (%s unchanged), %s failed in %.2fs",
+            report.succeeded, report.unchanged, report.failed, report.elapsed
+        )
+        return report
+
+    def _prepare_output(self) -> None:
+        if self.jsonl_stream is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+        if self.manifest is not None:
+            # Changed pages keep their file; new pages must not take one over
+            self._used_names.update(
+                os.path.splitext(os.path.basename(entry.output))[0]
+                for entry in map(self.manifest.get, self.manifest) if entry.output
+            )
+
+    async def _load_sitemap(self, scheduler: FetchScheduler) -> None:
+        if self.sitemap:
+            self.lastmods = await load_sitemap(scheduler, self.sitemap)
+
+    def _finish(self) -> None:
+        if self.manifest is not None:
+            self.manifest.save()
+
+    def _create_scheduler(self) -> FetchScheduler:
+        return FetchScheduler(
+            self.scraper,
+            max_concurrency=self.concurrency,
+            per_host_concurrency=self.per_host_concurrency,
+            per_host_rate=self.per_host_rate
+        )
+
+    async def _process(self,
+                       url: str,
+                       scheduler: FetchScheduler,
+                       limiter: anyio.CapacityLimiter,
+                       depth: int = 0,
+                       on_fetched: Optional[Callable[[FetchResult], Awaitable[None]]] = None) -> BatchItem:
+        """
+        Fetch, convert and write one URL. ``depth`` is the crawl depth, also
+        used as fetch priority; ``on_fetched`` sees the page before conversion.
+        """
+        started = time.perf_counter()
+        try:
+            entry = self.manifest.get(url) if self.manifest is not None else None
+            lastmod = self.lastmods.get(normalize_url(url))
+            if entry is not None and entry.unchanged_since(lastmod) and self._still_written(entry):
+                return BatchItem(url, True, time.perf_counter() - started, entry.title, 'sitemap',
+                                 entry.output, unchanged=True)
+
+            fetched = await scheduler.fetch_detailed(url, depth)
+            if fetched.throttled:
+                raise RuntimeError(f"Rate limited (status {fetched.status})")
+            if not fetched.ok:
+                raise RuntimeError("No content fetched")
+            if on_fetched is not None:
+                await on_fetched(fetched)
+
+            digest = content_hash(fetched.content) if self.manifest is not None else None
+            if entry is not None and entry.content_hash == digest and self._still_written(entry):
+                entry.validators, entry.depth = fetched.validators, depth
+                if lastmod is not None:
+                    entry.lastmod = lastmod  # Content is unchanged since the sitemap's date
+                self.manifest.record(url, entry)
+                return BatchItem(url, True, time.perf_counter() - started, entry.title, fetched.tier,
+                                 entry.output, unchanged=True)
+
+            async with limiter:
+                markdown = await self.converter.convert_to_markdown_async(fetched.content, fetched.document)
+                output = await self._write(url, fetched.title, fetched.tier, markdown,
+                                           entry.output if entry is not None else None)
+            if self.manifest is not None:
+                self.manifest.record(url, ManifestEntry(
+                    digest, output, fetched.title, fetched.validators, lastmod, depth
+                ))
+            return BatchItem(url, True, time.perf_counter() - started, fetched.title, fetched.tier, output)
+        except Exception as e:
+            self.logger.error("Batch conversion failed for %s: %s", url, e)
+            item = BatchItem(url, False, time.perf_counter() - started, error=str(e))
+            if self.jsonl_stream is not None:
+                self._write_record(item, "")
+            return item
+
+    def _still_written(self, entry: ManifestEntry) -> bool:
+        """The output of the previous conversion is still where this run writes."""
+        if self.jsonl_stream is not None:
+            return entry.output is None
+        return (
+            entry.output is not None
+            and os.path.dirname(os.path.abspath(entry.output)) == os.path.abspath(self.output_dir)
+            and os.path.exists(entry.output)
+        )
+
+    async def _write(self,
+                     url: str,
+                     title: str,
+                     tier: Optional[str],
+                     markdown: str,
+                     previous: Optional[str] = None) -> Optional[str]:
+        if self.jsonl_stream is not None:
+            self._write_record(BatchItem(url, True, 0.0, title, tier), markdown)
+            return None
+
+        if previous is not None and os.path.dirname(os.path.abspath(previous)) == os.path.abspath(self.output_dir):
+            filepath = previous  # Overwrite the page's file from the last run
+        else:
+            filepath = os.path.join(self.output_dir, f"{self._output_name(url)}.md")
+        if not await anyio.to_thread.run_sync(self.storage.save, markdown, filepath):
+            raise RuntimeError(f"Failed to save {filepath}")
+        return filepath
+
+    def _write_record(self, item: BatchItem, markdown: str) -> None:
+        record = {
+            'url': item.url,
+            'ok': item.ok,
+            'title': item.title,
+            'tier': item.tier,
+            'markdown': markdown,
+            'error': item.error
+        }
+        self.jsonl_stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _output_name(self, url: str) -> str:
+        """Derive a unique, filesystem-safe file name from the URL."""
+        parsed = urlparse(url)
+        base = slugify(f"{parsed.netloc} {parsed.path.replace('/', ' ')}") or "page"
+        name, index = base, 1
+        while name in self._used_names:
+            index += 1
+            name = f"{base}-{index}"
+        self._used_names.add(name)
+        return name
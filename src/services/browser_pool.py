@@ -0,0 +1,215 @@
+import itertools
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple
+
+import anyio
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+
+from ..config import PLAYWRIGHT_POOL_SETTINGS
+from .logger import LoggerService
+
+try:
+    import psutil
+except ImportError:  # Memory-based recycling is optional
+    psutil = None
+
+# Chromium ignores unknown switches; this one lets us find each browser's process
+_MARKER_SWITCH = '--url-markdown-pool'
+_browser_ids = itertools.count(1)
+
+
+class _PooledBrowser:
+    """Book-keeping for one Chromium process owned by the pool."""
+
+    def __init__(self, browser: Browser, marker: str) -> None:
+        self.browser = browser
+        self.marker = marker
+        self.process = None  # psutil.Process of the browser, found on first measurement
+        self.pages_served = 0
+        self.active = 0
+        self.retired = False
+        self.idle_contexts: List[Tuple[Optional[str], BrowserContext]] = []  # (user agent, context), oldest first
+
+
+class PlaywrightBrowserPool:
+    """
+    Long-lived pool of headless Chromium browsers.
+
+    A fixed number of browser slots is kept; each slot allows a bounded number
+    of concurrent pages and recycles its browser contexts between fetches.
+    A browser is retired after serving ``restart_after_pages`` pages or when
+    the pooled browsers' combined RSS exceeds ``memory_limit_mb`` (requires psutil);
+    the next page on that slot launches a fresh browser while the old one
+    drains its remaining pages and is closed.
+    """
+
+    def __init__(self,
+                 browsers: int = PLAYWRIGHT_POOL_SETTINGS['browsers'],
+                 max_pages_per_browser: int = PLAYWRIGHT_POOL_SETTINGS['max_pages_per_browser'],
+                 restart_after_pages: int = PLAYWRIGHT_POOL_SETTINGS['restart_after_pages'],
+                 memory_limit_mb: int = PLAYWRIGHT_POOL_SETTINGS['memory_limit_mb'],
+                 launch_args: Optional[List[str]] = None) -> None:
+        self.logger = LoggerService()
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.restart_after_pages = restart_after_pages
+        self.memory_limit_mb = memory_limit_mb
+        self.launch_args = launch_args or PLAYWRIGHT_POOL_SETTINGS['launch_args']
+        self._playwright = None
+        self._slots: List[Optional[_PooledBrowser]] = [None] * max(1, browsers)
+        self._limits = [anyio.Semaphore(self.max_pages_per_browser) for _ in self._slots]
+        self._lock = anyio.Lock()
+        self._next_slot = 0
+
+    def _pick_slot(self) -> int:
+        """Pick the slot with the most free page capacity, rotating on ties."""
+        count = len(self._slots)
+        order = [(self._next_slot + i) % count for i in range(count)]
+        self._next_slot = (self._next_slot + 1) % count
+        return max(order, key=lambda index: self._limits[index].value)
+
+    async def _acquire_browser(self, index: int) -> _PooledBrowser:
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            pooled = self._slots[index]
+            if pooled is None or pooled.retired or not pooled.browser.is_connected():
+                self.logger.info("Launching pooled Chromium browser in slot %s", index)
+                marker = f"{_MARKER_SWITCH}={os.getpid()}-{next(_browser_ids)}"
+                browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=[*self.launch_args, marker]
+                )
+                pooled = _PooledBrowser(browser, marker)
+                self._slots[index] = pooled
+            pooled.active += 1
+            return pooled
+
+    @asynccontextmanager
+    async def page(self, user_agent: Optional[str] = None) -> AsyncIterator[Page]:
+        """
+        Borrow a page from a pooled browser for the duration of the block.
+        Contexts are only reused for the same ``user_agent``, which a context
+        can't change after creation.
+        """
+        index = self._pick_slot()
+        async with self._limits[index]:
+            pooled = await self._acquire_browser(index)
+            context: Optional[BrowserContext] = None
+            page: Optional[Page] = None
+            try:
+                context = self._take_idle_context(pooled, user_agent)
+                if context is None:
+                    context = await pooled.browser.new_context(user_agent=user_agent)
+                page = await context.new_page()
+                yield page
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await self._release(pooled, user_agent, context, page)
+
+    @staticmethod
+    def _take_idle_context(pooled: _PooledBrowser, user_agent: Optional[str]) -> Optional[BrowserContext]:
+        for position in range(len(pooled.idle_contexts) - 1, -1, -1):
+            if pooled.idle_contexts[position][0] == user_agent:
+                return pooled.idle_contexts.pop(position)[1]
+        return None
+
+    async def _release(self,
+                       pooled: _PooledBrowser,
+                       user_agent: Optional[str],
+                       context: Optional[BrowserContext],
+                       page: Optional[Page]) -> None:
+        pooled.active -= 1
+        pooled.pages_served += 1
+        try:
+            if page is not None:
+                await page.close()
+            if context is not None:
+                if pooled.retired:
+                    await context.close()
+                else:
+                    await context.clear_cookies()
+                    pooled.idle_contexts.append((user_agent, context))
+                    if len(pooled.idle_contexts) > self.max_pages_per_browser:
+                        # Keep the most recently used agents' contexts
+                        await pooled.idle_contexts.pop(0)[1].close()
+        except Exception as e:
+            self.logger.debug("Failed to recycle browser context: %s", e)
+
+        if not pooled.retired and self._should_retire(pooled):
+            pooled.retired = True
+        if pooled.retired and pooled.active == 0:
+            await self._close_browser(pooled)
+
+    def _should_retire(self, pooled: _PooledBrowser) -> bool:
+        if self.restart_after_pages and pooled.pages_served >= self.restart_after_pages:
+            self.logger.info("Recycling browser after %s pages", pooled.pages_served)
+            return True
+        rss_mb = self._browsers_rss_mb()
+        if self.memory_limit_mb and rss_mb > self.memory_limit_mb:
+            self.logger.info("Recycling browser, pool memory at %.0f MB", rss_mb)
+            return True
+        return False
+
+    def _browsers_rss_mb(self) -> float:
+        """
+        Combined RSS of the pooled browsers' process trees. Other children of
+        this process (conversion workers, Selenium's Chrome) don't count.
+        """
+        if psutil is None:
+            return 0.0
+        total = 0
+        for pooled in self._slots:
+            process = self._browser_process(pooled) if pooled is not None else None
+            if process is None:
+                continue
+            try:
+                tree = [process, *process.children(recursive=True)]
+            except psutil.Error:
+                continue
+            for member in tree:
+                try:
+                    total += member.memory_info().rss
+                except psutil.Error:
+                    continue
+        return total / (1024 * 1024)
+
+    @staticmethod
+    def _browser_process(pooled: _PooledBrowser):
+        """The browser's main process, located by its marker switch."""
+        if pooled.process is not None and pooled.process.is_running():
+            return pooled.process
+        pooled.process = None
+        for child in psutil.Process().children(recursive=True):
+            try:
+                if pooled.marker in child.cmdline():
+                    pooled.process = child
+                    break
+            except psutil.Error:
+                continue
+        return pooled.process
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        for _, context in pooled.idle_contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        pooled.idle_contexts.clear()
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            self.logger.debug("Failed to close browser: %s", e)
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        async with self._lock:
+            for index, pooled in enumerate(self._slots):
+                if pooled is not None:
+                    pooled.retired = True
+                    await self._close_browser(pooled)
+                    self._slots[index] = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from importlib import metadata
+from typing import Any, Dict, Optional
+
+from ..config import CONTENT_SELECTORS, CLEANING_SELECTORS, CONVERSION_CACHE_SETTINGS
+from .logger import LoggerService
+from .metrics import MetricsRegistry
+
+
+def converter_fingerprint(options: Dict[str, Any]) -> str:
+    """
+    Fingerprint everything besides the HTML that affects conversion output:
+    the selector configuration, the converter options and the markdownify
+    version.
+    """
+    try:
+        markdownify_version = metadata.version('markdownify')
+    except metadata.PackageNotFoundError:
+        markdownify_version = 'unknown'
+    payload = json.dumps({
+        'content_selectors': CONTENT_SELECTORS,
+        'cleaning_selectors': CLEANING_SELECTORS,
+        'options': options,
+        'markdownify': markdownify_version
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ConversionCache:
+    """
+    Memoizes HTML to Markdown conversions.
+
+    Keys are a SHA-256 of the converter fingerprint plus the HTML, so a hit
+    is only possible for byte-identical input under identical settings.
+    Results live in an in-memory LRU and, when ``path`` is given, in a SQLite
+    store that survives restarts.
+    """
+
+    def __init__(self,
+                 max_entries: int = CONVERSION_CACHE_SETTINGS['max_entries'],
+                 path: Optional[str] = CONVERSION_CACHE_SETTINGS['path']) -> None:
+        self.logger = LoggerService()
+        self.metrics = MetricsRegistry()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS conversions (key TEXT PRIMARY KEY, markdown TEXT NOT NULL)'
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(html_content: str, fingerprint: str) -> str:
+        digest = hashlib.sha256(fingerprint.encode('ascii'))
+        digest.update(html_content.encode('utf-8', errors='surrogatepass'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            markdown = self._memory.get(key)
+            if markdown is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    'SELECT markdown FROM conversions WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    markdown = row[0]
+                    self._remember(key, markdown)
+
+            if markdown is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self.metrics.increment('cache_events_total', cache='conversion', event='miss' if markdown is None else 'hit')
+        return markdown
+
+    def put(self, key: str, markdown: str) -> None:
+        with self._lock:
+            self._remember(key, markdown)
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO conversions (key, markdown) VALUES (?, ?)',
+                    (key, markdown)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, markdown: str) -> None:
+        self._memory[key] = markdown
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._memory)}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
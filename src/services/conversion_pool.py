@@ -0,0 +1,65 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from ..config import CONVERSION_POOL_SETTINGS
+from .logger import LoggerService
+from .metrics import MetricsRegistry
+
+# Converter owned by each worker process, built once by the pool initializer
+_worker_converter = None
+
+
+def _init_worker(engine: str) -> None:
+    global _worker_converter
+    from .converter_factory import create_converter
+    _worker_converter = create_converter(engine, use_cache=False)  # The parent process does the caching
+
+
+def _convert_in_worker(html_content: str) -> Tuple[str, Dict[str, list]]:
+    markdown = _worker_converter.convert_to_markdown(html_content)
+    # The stage timings go back with the result; the worker's registry is never exported
+    return markdown, MetricsRegistry().drain()
+
+
+class ConversionPool:
+    """
+    Runs HTML to Markdown conversion on a pool of worker processes.
+
+    Parsing, cleaning and markdownify are CPU bound and hold the GIL, so
+    moving them to separate processes keeps the event loop (and the Qt UI)
+    responsive and lets batch jobs use every core. The workers are spawned
+    lazily on the first conversion.
+    """
+
+    def __init__(self,
+                 engine: str,
+                 processes: int = CONVERSION_POOL_SETTINGS['processes']) -> None:
+        self.logger = LoggerService()
+        self.engine = engine
+        self.processes = max(1, processes)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self.logger.info("Starting %s conversion worker processes (%s)", self.processes, self.engine)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.engine,)
+            )
+        return self._executor
+
+    async def convert(self, html_content: str) -> str:
+        """Convert in a worker process and return the Markdown; its stage timings join this process's metrics."""
+        loop = asyncio.get_running_loop()
+        markdown, metrics = await loop.run_in_executor(self._get_executor(), _convert_in_worker, html_content)
+        MetricsRegistry().merge(metrics)
+        return markdown
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,27 @@
+from typing import Optional
+from ..config import CONVERTER_SETTINGS
+from .conversion_cache import ConversionCache
+from .conversion_pool import ConversionPool
+from .html_converter import HTMLConverter
+
+CONVERTER_ENGINES = ('bs4', 'lxml')
+
+
+def create_converter(engine: str = CONVERTER_SETTINGS['engine'],
+                     cache: Optional[ConversionCache] = None,
+                     processes: int = 0,
+                     use_cache: bool = True) -> HTMLConverter:
+    """
+    Build the HTML to Markdown converter for the named engine.
+
+    With ``processes`` > 0 its async API converts on that many worker
+    processes; pass ``CONVERSION_POOL_SETTINGS['processes']`` for the default.
+    ``use_cache=False`` builds it without the default conversion cache.
+    """
+    if engine not in CONVERTER_ENGINES:
+        raise ValueError(f"Unknown converter engine: {engine}")
+    pool = ConversionPool(engine, processes) if processes > 0 else None
+    if engine == 'lxml':
+        from .lxml_converter import LxmlHTMLConverter
+        return LxmlHTMLConverter(cache, pool, use_cache)
+    return HTMLConverter(cache, pool, use_cache)
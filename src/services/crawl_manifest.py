@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from hashlib import blake2b
+from typing import Dict, Iterator, Optional
+
+from ..config import INCREMENTAL_SETTINGS
+from .logger import LoggerService
+from .url_utils import normalize_url
+
+
+def content_hash(content: str) -> str:
+    return blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """What the previous runs know about one converted URL."""
+    content_hash: str
+    output: Optional[str] = None  # Markdown file written for the page (None in JSONL mode)
+    title: str = ""
+    validators: Dict[str, str] = field(default_factory=dict)  # etag / last-modified of the response
+    lastmod: Optional[float] = None  # sitemap <lastmod> when the page was converted
+    depth: Optional[int] = None  # crawl depth at which the page was found
+    converted_at: float = 0.0
+
+    def unchanged_since(self, lastmod: Optional[float]) -> bool:
+        """The sitemap says the page hasn't changed since it was converted."""
+        return lastmod is not None and self.lastmod is not None and lastmod <= self.lastmod
+
+
+class CrawlManifest:
+    """
+    URL -> ManifestEntry map that makes repeated runs incremental.
+
+    Stored as JSON and rewritten atomically, every ``save_every`` updates
+    and on ``save``; URLs are keyed in normalized form.
+    """
+
+    def __init__(self, path: str, save_every: int = INCREMENTAL_SETTINGS['save_every']) -> None:
+        self.logger = LoggerService()
+        self.path = path
+        self.save_every = save_every
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._entries = {url: ManifestEntry(**entry) for url, entry in data.get('entries', {}).items()}
+            self.logger.info("Loaded manifest with %s URLs", len(self._entries))
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.error("Failed to load manifest: %s", e)
+            self._entries = {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps(
+                {'entries': {url: asdict(entry) for url, entry in self._entries.items()}},
+                indent=1, sort_keys=True
+            )
+            self._unsaved = 0
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.error("Failed to save manifest: %s", e)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def get(self, url: str) -> Optional[ManifestEntry]:
+        return self._entries.get(normalize_url(url))
+
+    def record(self, url: str, entry: ManifestEntry) -> None:
+        entry.converted_at = entry.converted_at or time.time()
+        with self._lock:
+            self._entries[normalize_url(url)] = entry
+            self._unsaved += 1
+            should_save = self.save_every and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
@@ -0,0 +1,263 @@
+import fnmatch
+import heapq
+import itertools
+import posixpath
+import re
+import time
+from array import array
+from hashlib import blake2b
+from typing import Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+import anyio
+import lxml.html
+from lxml.etree import ParserError
+
+from ..config import CRAWLER_SETTINGS
+from ..interfaces.converter import IConverter
+from ..interfaces.scraper import FetchResult, IScraper
+from ..interfaces.storage import IStorage
+from .batch_converter import BatchConverter, BatchReport
+from .url_utils import normalize_url
+
+_SCHEMES = ('http', 'https')
+
+
+def _ignored_param(name: str) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in CRAWLER_SETTINGS['ignored_query_params'])
+
+
+def _site(netloc: str) -> str:
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def canonicalize_url(href: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve ``href`` against ``base_url`` and normalize it for deduplication:
+    normalize_url plus dropping tracking parameters and dot segments.
+    Returns None for links that aren't http(s) pages (mailto:, javascript:, ...).
+    """
+    href = href.strip()
+    if not href or href.startswith('#'):
+        return None
+    url = urljoin(base_url, href) if base_url else href
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in _SCHEMES or not parts.hostname:
+        return None
+    path = '/' + posixpath.normpath(parts.path).lstrip('/') if parts.path else '/'
+    if parts.path.endswith('/') and not path.endswith('/'):
+        path += '/'  # normpath strips it, but /docs/ and /docs may be different pages
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _ignored_param(name)
+    ], quote_via=quote)  # Keep spaces as %20 rather than '+'
+    return normalize_url(urlunsplit((parts.scheme, parts.netloc, path, query, '')))
+
+
+def extract_links(html: str, base_url: str, document=None) -> List[str]:
+    """Canonical URLs of the ``<a href>`` links in a page, honouring ``<base href>``."""
+    try:
+        root = document if document is not None else lxml.html.document_fromstring(html)
+    except (ParserError, ValueError):
+        return []
+    base = root.xpath('string(//base/@href)').strip()
+    if base:
+        base_url = urljoin(base_url, base)
+    links = dict.fromkeys(
+        url for url in (canonicalize_url(href, base_url) for href in root.xpath('//a/@href'))
+        if url is not None
+    )
+    return list(links)
+
+
+class DigestSet:
+    """
+    Set of URLs stored as 64-bit BLAKE2b digests in an open-addressing table.
+
+    Costs about 16 bytes per URL (8-byte slots kept at most half full), so a
+    crawl of hundreds of thousands of pages stays at a few megabytes. Two URLs
+    share a digest with negligible probability (~1e-8 at a million URLs).
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        size = 1
+        while size < capacity * 2:
+            size *= 2
+        self._slots = array('Q', bytes(8 * size))
+        self._count = 0
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        digest = int.from_bytes(blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+        return digest or 1  # 0 marks an empty slot
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, url: str) -> bool:
+        digest = self._digest(url)
+        slots, mask = self._slots, len(self._slots) - 1
+        index = digest & mask
+        while slots[index]:
+            if slots[index] == digest:
+                return True
+            index = (index + 1) & mask
+        return False
+
+    def add(self, url: str) -> bool:
+        """Add ``url``; returns False if it was already present."""
+        if (self._count + 1) * 2 > len(self._slots):
+            self._grow()
+        if not self._insert(self._slots, self._digest(url)):
+            return False
+        self._count += 1
+        return True
+
+    @staticmethod
+    def _insert(slots: array, digest: int) -> bool:
+        mask = len(slots) - 1
+        index = digest & mask
+        while slots[index]:
+            if slots[index] == digest:
+                return False
+            index = (index + 1) & mask
+        slots[index] = digest
+        return True
+
+    def _grow(self) -> None:
+        slots = array('Q', bytes(16 * len(self._slots)))
+        for digest in self._slots:
+            if digest:
+                self._insert(slots, digest)
+        self._slots = slots
+
+
+class Crawler(BatchConverter):
+    """
+    Converts a site by following its links from one or more seed URLs.
+
+    Pages are visited breadth first: a frontier ordered by depth feeds
+    ``concurrency`` workers, each fetching through the FetchScheduler (with
+    the depth as priority), queueing the same-site links of the page, then
+    converting and writing it like a batch item. Links are canonicalized
+    and deduplicated in a DigestSet; ``include``/``exclude`` are regular
+    expressions searched in the canonical URL.
+
+    In incremental runs, pages skipped as unchanged contribute no links, so
+    the URLs of the manifest (at their recorded depth) and of the sitemap
+    are queued as well.
+    """
+
+    def __init__(self,
+                 scraper: IScraper,
+                 converter: IConverter,
+                 storage: IStorage,
+                 max_depth: int = CRAWLER_SETTINGS['max_depth'],
+                 max_pages: int = CRAWLER_SETTINGS['max_pages'],
+                 include: Sequence[str] = (),
+                 exclude: Sequence[str] = (),
+                 **options) -> None:
+        """``options`` are passed on to BatchConverter (concurrency, output_dir, ...)."""
+        super().__init__(scraper, converter, storage, **options)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.include = [re.compile(pattern) for pattern in include]
+        self.exclude = [re.compile(pattern) for pattern in exclude]
+        self.seen = DigestSet()
+        self._sites: set[str] = set()
+        self._frontier: List[Tuple[int, int, str]] = []  # (depth, sequence, url) heap
+        self._sequence = itertools.count()
+        self._in_progress = 0
+        self._changed = anyio.Event()
+
+    def allowed(self, url: str) -> bool:
+        """Same site as a seed (``www.`` ignored), a page-like path and matching the include/exclude patterns."""
+        parts = urlsplit(url)
+        if _site(parts.netloc) not in self._sites:
+            return False
+        if posixpath.splitext(parts.path)[1].lower() in CRAWLER_SETTINGS['skip_extensions']:
+            return False
+        if self.include and not any(pattern.search(url) for pattern in self.include):
+            return False
+        return not any(pattern.search(url) for pattern in self.exclude)
+
+    def enqueue(self, url: str, depth: int) -> bool:
+        """Queue ``url`` unless it was seen, is out of scope or the page budget is spent."""
+        if depth > self.max_depth or len(self.seen) >= self.max_pages or not self.allowed(url):
+            return False
+        if not self.seen.add(url):
+            return False
+        heapq.heappush(self._frontier, (depth, next(self._sequence), url))
+        self._notify()
+        return True
+
+    async def run(self, urls: Iterable[str]) -> BatchReport:
+        """Crawl from the seed ``urls`` until the frontier is exhausted."""
+        seeds = [url for url in map(canonicalize_url, urls) if url is not None]
+        self._sites.update(_site(urlsplit(url).netloc) for url in seeds)
+        for url in seeds:
+            if self.seen.add(url):  # Seeds are crawled even if the patterns exclude them
+                heapq.heappush(self._frontier, (0, next(self._sequence), url))
+
+        report = BatchReport()
+        self._prepare_output()
+        if self.manifest is not None:
+            for url in self.manifest:
+                if (canonical := canonicalize_url(url)) is not None:
+                    self.enqueue(canonical, self.manifest.get(url).depth or 0)
+        self.logger.info(
+            "Starting crawl from %s seed URLs, depth %s, concurrency %s",
+            len(seeds), self.max_depth, self.concurrency
+        )
+        scheduler = self._create_scheduler()
+        limiter = anyio.CapacityLimiter(self.concurrency)
+        started = time.perf_counter()
+
+        async def worker() -> None:
+            while (entry := await self._next()) is not None:
+                depth, _, url = entry
+                try:
+                    report.items.append(await self._process(
+                        url, scheduler, limiter, depth=depth,
+                        on_fetched=lambda fetched: self._follow_links(fetched, depth + 1)
+                    ))
+                finally:
+                    self._in_progress -= 1
+                    self._notify()
+
+        async with scheduler, anyio.create_task_group() as tg:
+            await self._load_sitemap(scheduler)
+            for url in map(canonicalize_url, self.lastmods):
+                if url is not None:
+                    self.enqueue(url, 0)
+            for _ in range(self.concurrency):
+                tg.start_soon(worker)
+
+        report.elapsed = time.perf_counter() - started
+        self._finish()
+        self.logger.info(
+            "Crawl finished: %s pages, %s succeeded (%s unchanged), %s failed in %.2fs (%s URLs seen)",
+            len(report.items), report.succeeded, report.unchanged, report.failed, report.elapsed, len(self.seen)
+        )
+        return report
+
+    async def _next(self) -> Optional[Tuple[int, int, str]]:
+        """Next frontier entry; None once it is empty and no page in progress can add to it."""
+        while True:
+            if self._frontier:
+                self._in_progress += 1
+                return heapq.heappop(self._frontier)
+            if self._in_progress == 0:
+                return None
+            await self._changed.wait()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = anyio.Event()
+
+    async def _follow_links(self, fetched: FetchResult, depth: int) -> None:
+        if depth > self.max_depth:
+            return
+        links = await anyio.to_thread.run_sync(extract_links, fetched.content, fetched.url, fetched.document)
+        queued = sum(self.enqueue(url, depth) for url in links)
+        self.logger.debug("%s: %s links, %s queued", fetched.url, len(links), queued)
@@ -0,0 +1,153 @@
+import codecs
+import re
+from functools import lru_cache
+from typing import FrozenSet, Mapping, Optional
+
+from ..config import DECODING_SETTINGS
+from .metrics import MetricsRegistry
+
+try:
+    import brotli
+except ImportError:  # br is only advertised when some layer can decode it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # same for zstd
+    zstandard = None
+
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),  # -sig strips the BOM while decoding
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _codec_name(label: str) -> Optional[str]:
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+
+def charset_from_headers(headers: Mapping[str, str], default: Optional[str] = 'utf-8') -> Optional[str]:
+    """Return the charset declared in Content-Type if Python knows it, else ``default``."""
+    match = _CHARSET_RE.search(headers.get('Content-Type', ''))
+    if match:
+        return _codec_name(match.group(1)) or default
+    return default
+
+
+# --- content (transfer) coding ---------------------------------------------------
+
+@lru_cache(maxsize=None)
+def transport_encodings(transport: str) -> FrozenSet[str]:
+    """Content codings the HTTP client decodes by itself ('aiohttp' or 'requests')."""
+    if transport == 'aiohttp':
+        from aiohttp import compression_utils
+        supported = {'gzip', 'deflate'}
+        if getattr(compression_utils, 'HAS_BROTLI', False):
+            supported.add('br')
+        if getattr(compression_utils, 'HAS_ZSTD', False):
+            supported.add('zstd')
+        return frozenset(supported)
+    from urllib3.util import make_headers
+    return frozenset(
+        coding.strip() for coding in make_headers(accept_encoding=True)['accept-encoding'].split(',')
+    )
+
+
+def accept_encoding(transport: str) -> str:
+    """
+    Accept-Encoding value for ``transport``: what the client decodes, plus
+    br/zstd for requests, whose unknown codings reach ContentDecoder intact.
+    aiohttp rejects codings it can't decode, so it only gets its own.
+    """
+    codings = set(transport_encodings(transport))
+    if transport == 'requests':
+        if brotli is not None:
+            codings.add('br')
+        if zstandard is not None:
+            codings.add('zstd')
+    order = ('zstd', 'br', 'gzip', 'deflate')
+    return ', '.join(coding for coding in order if coding in codings)
+
+
+class ContentDecoder:
+    """Decompresses br/zstd bodies that the HTTP client passed through undecoded."""
+
+    def __init__(self, headers: Mapping[str, str], transport: str) -> None:
+        coding = headers.get('Content-Encoding', '').strip().lower()
+        self._decompressor = None
+        if not coding or coding == 'identity' or coding in transport_encodings(transport):
+            return
+        if coding == 'br' and brotli is not None:
+            self._decompressor = brotli.Decompressor().process
+        elif coding == 'zstd' and zstandard is not None:
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj().decompress
+
+    @property
+    def active(self) -> bool:
+        return self._decompressor is not None
+
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decompressor(chunk) if self._decompressor is not None else chunk
+
+
+# --- character encoding -------------------------------------------------------------
+
+def sniff_encoding(head: bytes, headers: Optional[Mapping[str, str]] = None) -> Optional[str]:
+    """
+    Cheap charset resolution in HTML precedence order: byte order mark,
+    Content-Type header, then ``<meta charset>`` in the first bytes of the
+    document. Returns None when nothing is declared.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return _record('bom', encoding)
+
+    if headers is not None and (encoding := charset_from_headers(headers, default=None)):
+        return _record('header', encoding)
+
+    match = _META_CHARSET_RE.search(head[:DECODING_SETTINGS['sniff_bytes']])
+    if match and (encoding := _codec_name(match.group(1).decode('ascii', 'ignore'))):
+        if encoding.startswith('utf_16') or encoding.startswith('utf-16'):
+            encoding = 'utf-8'  # A document that could be read as ASCII isn't UTF-16
+        return _record('meta', encoding)
+    return None
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Last resort for undeclared documents: UTF-8 if the sample is valid UTF-8,
+    otherwise statistical detection over at most ``detect_bytes`` bytes.
+    """
+    sample = sample[:DECODING_SETTINGS['detect_bytes']]
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample)  # Tolerates a cut-off final character
+        return _record('utf8', 'utf-8')
+    except UnicodeDecodeError:
+        pass
+
+    from charset_normalizer import from_bytes
+    best = from_bytes(sample).best()
+    if best is not None and (encoding := _codec_name(best.encoding)):
+        return _record('detected', encoding)
+    return _record('fallback', DECODING_SETTINGS['fallback_encoding'])
+
+
+def resolve_encoding(head: bytes, headers: Optional[Mapping[str, str]] = None) -> str:
+    return sniff_encoding(head, headers) or detect_encoding(head)
+
+
+def decode_body(body: bytes, headers: Optional[Mapping[str, str]] = None) -> str:
+    """Decode a complete, transport-decoded body."""
+    with MetricsRegistry().span('decode_seconds'):
+        return body.decode(resolve_encoding(body, headers), errors='replace')
+
+
+def _record(source: str, encoding: str) -> str:
+    MetricsRegistry().increment('charset_resolutions_total', source=source)
+    return encoding
@@ -0,0 +1,183 @@
+import threading
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import anyio
+from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    SessionNotCreatedException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from ..config import SELENIUM_POOL_SETTINGS
+from .logger import LoggerService
+
+# Errors after which the browser session itself is gone; anything else
+# (a timed-out wait or page load, a renderer error) leaves the driver usable
+_SESSION_ERRORS = (InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException)
+
+
+class _PooledDriver:
+    """One Chrome driver owned by the pool."""
+
+    def __init__(self, driver: webdriver.Chrome) -> None:
+        self.driver = driver
+        self.pages = 0
+
+
+class SeleniumDriverPool:
+    """
+    Pool of warm headless Chrome drivers.
+
+    Fetches run in worker threads, at most ``drivers`` at a time. Each fetch
+    checks out an idle driver (starting one on first use) and returns it
+    afterwards, so a fetch only pays for page navigation. Between fetches
+    the driver goes back to ``about:blank`` with its cookies and the
+    storage of the visited origin cleared. Drivers are restarted after
+    ``restart_after_pages`` navigations or when their session is lost.
+    """
+
+    def __init__(self,
+                 drivers: int = SELENIUM_POOL_SETTINGS['drivers'],
+                 page_load_strategy: str = SELENIUM_POOL_SETTINGS['page_load_strategy'],
+                 page_load_timeout: int = SELENIUM_POOL_SETTINGS['page_load_timeout'],
+                 restart_after_pages: int = SELENIUM_POOL_SETTINGS['restart_after_pages'],
+                 block_images: bool = SELENIUM_POOL_SETTINGS['block_images'],
+                 blocked_url_patterns: Optional[List[str]] = None) -> None:
+        self.logger = LoggerService()
+        self.page_load_strategy = page_load_strategy
+        self.page_load_timeout = page_load_timeout
+        self.restart_after_pages = restart_after_pages
+        self.block_images = block_images
+        self.blocked_url_patterns = (
+            SELENIUM_POOL_SETTINGS['blocked_url_patterns']
+            if blocked_url_patterns is None else blocked_url_patterns
+        )
+        self.max_drivers = max(1, drivers)
+        self._limiter: Optional[anyio.CapacityLimiter] = None  # Created in the event loop on first fetch
+        self._idle: List[_PooledDriver] = []
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+        self._closed = False
+
+    def _build_options(self) -> webdriver.ChromeOptions:
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.page_load_strategy = self.page_load_strategy
+        if self.block_images:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_experimental_option(
+                'prefs', {'profile.managed_default_content_settings.images': 2}
+            )
+        return options
+
+    def _start_driver(self) -> _PooledDriver:
+        self.logger.debug("Starting pooled Chrome driver...")
+        driver = webdriver.Chrome(options=self._build_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.blocked_url_patterns:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_url_patterns})
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return _PooledDriver(driver)
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug("Failed to quit Chrome driver: %s", e)
+
+    def _checkout(self) -> _PooledDriver:
+        with self._drivers_lock:
+            pooled = self._idle.pop() if self._idle else None
+        if pooled is not None and pooled.pages >= self.restart_after_pages:
+            self.logger.debug("Restarting Chrome driver after %s pages", pooled.pages)
+            self._quit_driver(pooled.driver)
+            pooled = None
+        return pooled or self._start_driver()
+
+    def _checkin(self, pooled: _PooledDriver) -> None:
+        with self._drivers_lock:
+            # An abandoned fetch may have started a driver beyond the pool size
+            if not self._closed and len(self._idle) < self.max_drivers:
+                self._idle.append(pooled)
+                return
+        self._quit_driver(pooled.driver)
+
+    def _reset(self, driver: webdriver.Chrome, url: str) -> None:
+        """Leave the page and clear what it stored, so the next fetch starts clean."""
+        driver.get('about:blank')
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        parts = urlsplit(url)
+        if parts.scheme and parts.netloc:
+            driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                'origin': f"{parts.scheme}://{parts.netloc}",
+                'storageTypes': 'local_storage,session_storage,indexeddb,websql,cache_storage,service_workers'
+            })
+
+    def _fetch_sync(self, url: str, user_agent: str) -> Tuple[str, str]:
+        # Also runs to completion when the awaiting task was cancelled, so
+        # the driver is always returned to the pool or discarded here
+        pooled = self._checkout()
+        driver = pooled.driver
+        try:
+            driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+            self.logger.info("Navigating to URL: %s", url)
+            pooled.pages += 1
+            driver.get(url)
+
+            self.logger.debug("Waiting for body element...")
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+
+            content = driver.page_source
+            title = driver.title
+            self.logger.debug("Page loaded - Title: %s", title)
+            return content, title
+        except _SESSION_ERRORS:
+            self._quit_driver(driver)
+            pooled = None
+            raise
+        finally:
+            if pooled is not None:
+                try:
+                    self._reset(driver, url)
+                except Exception as e:
+                    # Still on the page (or the driver is gone); don't hand it to another fetch
+                    self.logger.debug("Failed to reset Chrome driver, discarding it: %s", e)
+                    self._quit_driver(driver)
+                else:
+                    self._checkin(pooled)
+
+    async def fetch(self, url: str, user_agent: str) -> Tuple[str, str]:
+        """
+        Load ``url`` in a pooled driver and return ``(page_source, title)``.
+        Cancelling the caller abandons the wait; the worker thread finishes
+        the navigation in the background and then releases its driver.
+        """
+        if self._limiter is None:
+            self._limiter = anyio.CapacityLimiter(self.max_drivers)
+        return await anyio.to_thread.run_sync(
+            self._fetch_sync, url, user_agent, cancellable=True, limiter=self._limiter
+        )
+
+    def close(self) -> None:
+        """Quit every driver; drivers still fetching are quit when their fetch ends."""
+        with self._drivers_lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit_driver(pooled.driver)
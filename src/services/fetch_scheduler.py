@@ -0,0 +1,237 @@
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import anyio
+
+from ..config import SCHEDULER_SETTINGS
+from ..interfaces.scraper import FetchResult, IScraper
+from .logger import LoggerService
+from .metrics import MetricsRegistry
+
+_MAX_IDLE_HOSTS = 256  # host states kept before idle ones are pruned
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait per a Retry-After header (delta-seconds or HTTP-date); None if absent or invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class _HostState:
+    """Token bucket, in-flight count and backoff of one host."""
+    tokens: float
+    updated: float
+    active: int = 0
+    backoff_until: float = 0.0
+    failures: int = 0  # consecutive throttled responses
+
+    def refill(self, now: float, rate: float, burst: float) -> None:
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+    def ready_at(self, now: float, rate: float, concurrency: int) -> float:
+        """Earliest time a request may start; inf while the host is at its concurrency cap."""
+        if self.active >= concurrency:
+            return math.inf
+        token_at = now if self.tokens >= 1 else now + (1 - self.tokens) / rate
+        return max(token_at, self.backoff_until)
+
+    def idle(self, now: float, burst: float) -> bool:
+        return self.active == 0 and self.tokens >= burst and self.backoff_until <= now
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    host: str = field(compare=False)
+    event: anyio.Event = field(compare=False, default_factory=anyio.Event)
+    granted: bool = field(compare=False, default=False)
+    cancelled: bool = field(compare=False, default=False)
+
+
+class FetchScheduler(IScraper):
+    """
+    Admission control in front of a scraper.
+
+    Every fetch waits for a global slot, a free slot on its host and a token
+    from the host's bucket. Waiting fetches are admitted lowest ``priority``
+    first, but a fetch whose host is busy or backing off never holds up
+    fetches to other hosts. A 429 (or a 503 carrying Retry-After) puts the
+    host into backoff for the requested time, or exponentially longer per
+    consecutive refusal, and the fetch is queued again.
+
+    Use as an async context manager; it runs the timer that admits fetches
+    once tokens refill or a backoff ends.
+    """
+
+    def __init__(self,
+                 scraper: IScraper,
+                 max_concurrency: int = SCHEDULER_SETTINGS['max_concurrency'],
+                 per_host_concurrency: int = SCHEDULER_SETTINGS['per_host_concurrency'],
+                 per_host_rate: float = SCHEDULER_SETTINGS['per_host_rate'],
+                 per_host_burst: float = SCHEDULER_SETTINGS['per_host_burst'],
+                 max_retries: int = SCHEDULER_SETTINGS['max_retries']) -> None:
+        if not per_host_rate > 0:
+            raise ValueError(f"per_host_rate must be greater than 0, got {per_host_rate}")
+        self.scraper = scraper
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.per_host_rate = per_host_rate
+        self.per_host_burst = max(1.0, per_host_burst)
+        self.max_retries = max_retries
+        self.logger = LoggerService()
+        self.metrics = MetricsRegistry()
+        self._hosts: Dict[str, _HostState] = {}
+        self._queues: Dict[str, List[_Waiter]] = {}  # host -> waiting fetches, as a heap
+        self._sequence = itertools.count()
+        self._active = 0
+        self._changed = anyio.Event()
+        self._task_group = None
+
+    async def __aenter__(self) -> 'FetchScheduler':
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._run_timer)
+        return self
+
+    async def __aexit__(self, *exc_info) -> Optional[bool]:
+        self._task_group.cancel_scope.cancel()
+        task_group, self._task_group = self._task_group, None
+        return await task_group.__aexit__(*exc_info)
+
+    async def fetch_content(self, url: str, priority: int = 0) -> Tuple[str, str]:
+        result = await self.fetch_detailed(url, priority)
+        return result.content, result.title
+
+    async def fetch_detailed(self, url: str, priority: int = 0) -> FetchResult:
+        """Fetch ``url`` once admitted; lower ``priority`` values are admitted first."""
+        if self._task_group is None:
+            raise RuntimeError("FetchScheduler must be used with 'async with'")
+        host = urlsplit(url).netloc.lower()
+        for attempt in range(self.max_retries + 1):
+            queued = time.perf_counter()
+            await self._acquire(host, priority)
+            self.metrics.observe('scheduler_wait_seconds', time.perf_counter() - queued)
+            try:
+                result = await self.scraper.fetch_detailed(url)
+            finally:
+                self._release(host)
+            if not result.throttled:
+                self._host(host, time.monotonic()).failures = 0
+                return result
+            delay = self._back_off(host, result.retry_after)
+            self.logger.warning(
+                "%s throttled %s (status %s); backing off %.1fs, attempt %s of %s",
+                host, url, result.status, delay, attempt + 1, self.max_retries + 1
+            )
+        return result
+
+    def _host(self, host: str, now: float) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(tokens=self.per_host_burst, updated=now)
+        return state
+
+    async def _acquire(self, host: str, priority: int) -> None:
+        waiter = _Waiter(priority, next(self._sequence), host)
+        heapq.heappush(self._queues.setdefault(host, []), waiter)
+        self._dispatch()
+        try:
+            await waiter.event.wait()
+        except BaseException:
+            if waiter.granted:
+                self._release(host)
+            else:
+                waiter.cancelled = True
+            raise
+
+    def _release(self, host: str) -> None:
+        self._active -= 1
+        self._hosts[host].active -= 1
+        self._dispatch()
+
+    async def _run_timer(self) -> None:
+        """Admit waiters whose host becomes ready through time rather than a release."""
+        while True:
+            self._changed = anyio.Event()
+            wake_at = self._dispatch(notify=False)
+            timeout = None if math.isinf(wake_at) else max(0.0, wake_at - time.monotonic())
+            with anyio.move_on_after(timeout):
+                await self._changed.wait()
+
+    def _dispatch(self, notify: bool = True) -> float:
+        """
+        Admit waiters while global slots are free, best priority among the
+        ready hosts first. Returns when the next deferred host becomes ready
+        (inf if only a release can admit more).
+        """
+        now = time.monotonic()
+        wake_at = math.inf
+        while self._active < self.max_concurrency:
+            best, wake_at = None, math.inf
+            for host, queue in list(self._queues.items()):
+                while queue and queue[0].cancelled:
+                    heapq.heappop(queue)
+                if not queue:
+                    del self._queues[host]
+                    continue
+                state = self._host(host, now)
+                state.refill(now, self.per_host_rate, self.per_host_burst)
+                ready_at = state.ready_at(now, self.per_host_rate, self.per_host_concurrency)
+                if ready_at > now:
+                    wake_at = min(wake_at, ready_at)
+                elif best is None or queue[0] < best:
+                    best = queue[0]
+            if best is None:
+                break
+            heapq.heappop(self._queues[best.host])
+            state = self._hosts[best.host]
+            state.tokens -= 1
+            state.active += 1
+            self._active += 1
+            best.granted = True
+            best.event.set()
+        else:
+            wake_at = math.inf  # Full; the next release dispatches again
+
+        if len(self._hosts) > _MAX_IDLE_HOSTS:
+            self._prune(now)
+        if notify:
+            self._changed.set()  # Let the timer recompute its deadline
+        return wake_at
+
+    def _back_off(self, host: str, retry_after: Optional[float]) -> float:
+        now = time.monotonic()
+        state = self._host(host, now)
+        state.failures += 1
+        if retry_after is None:
+            retry_after = SCHEDULER_SETTINGS['backoff_base'] * 2 ** (state.failures - 1)
+        delay = min(retry_after, SCHEDULER_SETTINGS['backoff_max'])
+        state.backoff_until = max(state.backoff_until, now + delay)
+        state.tokens, state.updated = 0.0, now  # Resume slowly once the backoff ends
+        self.metrics.increment('scheduler_backoffs_total')
+        return delay
+
+    def _prune(self, now: float) -> None:
+        """Forget hosts whose state is back to the defaults, so long crawls don't accumulate them."""
+        for host, state in list(self._hosts.items()):
+            if host in self._queues or state.failures:
+                continue
+            state.refill(now, self.per_host_rate, self.per_host_burst)
+            if state.idle(now, self.per_host_burst):
+                del self._hosts[host]
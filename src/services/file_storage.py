@@ -8,13 +8,13 @@ class FileStorage(IStorage):
         self.logger = LoggerService()
         
     def save(self, content: str, filepath: str) -> bool:
-        self.logger.info(f"Attempting to save content to: {filepath}")
+        self.logger.info("Attempting to save content to: %s", filepath)
         with self._lock:
             try:
                 with open(filepath, 'w', encoding='utf-8') as file:
                     file.write(content)
-                self.logger.info(f"Successfully saved content to: {filepath}")
+                self.logger.info("Successfully saved content to: %s", filepath)
                 return True
             except Exception as e:
-                self.logger.error(f"Failed to save content: {str(e)}")
+                self.logger.error("Failed to save content: %s", e)
                 return False
\ No newline at end of file
@@ -1,45 +1,121 @@
-from markdownify import markdownify
-from bs4 import BeautifulSoup
+from typing import Any, Optional
+import anyio
+from bs4 import BeautifulSoup, Tag
 from ..interfaces.converter import IConverter
-from ..config import CONTENT_SELECTORS, CLEANING_SELECTORS
+from ..config import CONTENT_SELECTORS, CLEANING_SELECTORS, CONVERSION_CACHE_SETTINGS
+from .conversion_cache import ConversionCache, converter_fingerprint
+from .selector_matcher import CleaningMatcher, ContentMatcher
+from .markdown_emitter import MarkdownEmitter
+from .conversion_pool import ConversionPool
+from .metrics import MetricsRegistry
 
 class HTMLConverter(IConverter):
-    def __init__(self):
-        self.md = lambda x: markdownify(x, heading_style="ATX")
+    engine = 'bs4'
 
-    def convert_to_markdown(self, html_content: str) -> str:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        self._clean_content(soup)
-        main_content = self._extract_main_content(soup)
-        return self.md(str(main_content))
+    def __init__(self,
+                 cache: Optional[ConversionCache] = None,
+                 pool: Optional[ConversionPool] = None,
+                 use_cache: bool = True):
+        """Without a ``cache``, the default one is created unless ``use_cache`` is False."""
+        self.options = {'heading_style': "ATX"}
+        self.emitter = MarkdownEmitter(**self.options)
+        if cache is None and use_cache and CONVERSION_CACHE_SETTINGS['enabled']:
+            cache = ConversionCache()
+        self.cache = cache
+        self.pool = pool
+        self.metrics = MetricsRegistry()
+        self.cleaning_matcher = CleaningMatcher(CLEANING_SELECTORS)
+        self.content_matcher = ContentMatcher(CONTENT_SELECTORS)
+        self.fingerprint = converter_fingerprint({'engine': self.engine, **self.options})
+
+    def convert_to_markdown(self, html_content: str, document: Optional[Any] = None) -> str:
+        if self.cache is None:
+            return self._convert(html_content, document)
+
+        key = ConversionCache.make_key(html_content, self.fingerprint)
+        markdown = self.cache.get(key)
+        if markdown is None:
+            markdown = self._convert(html_content, document)
+            self.cache.put(key, markdown)
+        return markdown
+
+    async def convert_to_markdown_async(self, html_content: str, document: Optional[Any] = None) -> str:
+        """
+        Convert without blocking the event loop: on the process pool when one
+        is configured, otherwise in a worker thread. The cache is consulted
+        here, so hits never leave this process; its lookups and writes may
+        hit SQLite, so they run in a worker thread as well.
+        """
+        key = None
+        if self.cache is not None:
+            key = ConversionCache.make_key(html_content, self.fingerprint)
+            if (markdown := await anyio.to_thread.run_sync(self.cache.get, key)) is not None:
+                return markdown
+
+        if self.pool is not None:
+            # Parsed trees cannot cross process boundaries; the worker re-parses
+            with self.metrics.span('conversion_pool_seconds', engine=self.engine):
+                markdown = await self.pool.convert(html_content)
+        else:
+            markdown = await anyio.to_thread.run_sync(self._convert, html_content, document)
+
+        if key is not None:
+            await anyio.to_thread.run_sync(self.cache.put, key, markdown)
+        return markdown
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def _convert(self, html_content: str, document: Optional[Any] = None) -> str:
+        # BeautifulSoup cannot reuse an lxml tree, so ``document`` is ignored
+        with self._stage('parse'):
+            soup = BeautifulSoup(html_content, 'html.parser')
+        with self._stage('clean'):
+            self._clean_content(soup)
+        with self._stage('extract'):
+            main_content = self._extract_main_content(soup)
+        with self._stage('markdown'):
+            return self.emitter.emit(main_content)
+
+    def _stage(self, stage: str):
+        """Timing span for one conversion stage."""
+        return self.metrics.span('convert_stage_seconds', engine=self.engine, stage=stage)
 
     def _clean_content(self, soup: BeautifulSoup) -> None:
-        # Remove unwanted elements
-        for tag in CLEANING_SELECTORS['unwanted_tags']:
-            for element in soup.find_all(tag):
-                element.decompose()
-                
-        # Remove elements by class names
-        for class_name in CLEANING_SELECTORS['common_classes']:
-            for element in soup.find_all(class_=lambda x: x and class_name in x.lower()):
-                element.decompose()
-                
-        # Remove elements by IDs
-        for id_name in CLEANING_SELECTORS['common_ids']:
-            for element in soup.find_all(id=lambda x: x and id_name in x.lower()):
-                element.decompose()
-    
+        # Collect every match in one traversal, skipping matched subtrees
+        doomed = []
+        stack = [soup]
+        while stack:
+            for child in stack.pop().contents:
+                if not isinstance(child, Tag):
+                    continue
+                if self.cleaning_matcher.matches(
+                    child.name,
+                    ' '.join(child.get('class') or ()),
+                    child.get('id') or ''
+                ):
+                    doomed.append(child)
+                else:
+                    stack.append(child)
+
+        for element in doomed:
+            element.decompose()
+
     def _extract_main_content(self, soup: BeautifulSoup) -> str:
-        # Try to find element with matching ID
-        for content_id in CONTENT_SELECTORS['ids']:
-            main_content = soup.find(id=lambda x: x and content_id in x.lower())
-            if main_content:
-                return main_content
-                
-        # Try to find element with matching class
-        for content_class in CONTENT_SELECTORS['classes']:
-            main_content = soup.find(class_=content_class)
-            if main_content:
-                return main_content
-                
-        return soup.find('body')  # Fallback to body if no content is found
\ No newline at end of file
+        # Find the best-ranked element matching an ID or class selector
+        best, best_rank = None, None
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+            rank = self.content_matcher.rank(element.get('id') or '', element.get('class') or ())
+            if rank is not None and (best_rank is None or rank < best_rank):
+                best, best_rank = element, rank
+                if rank == 0:
+                    break
+
+        if best is not None:
+            return best
+        return soup.find('body')  # Fallback to body if no content is found
@@ -0,0 +1,215 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from ..config import HTTP_CACHE_SETTINGS
+from .logger import LoggerService
+from .metrics import MetricsRegistry
+from .url_utils import normalize_url
+
+# Response headers worth keeping alongside the body
+STORED_HEADERS = ('content-type', 'etag', 'last-modified', 'cache-control', 'expires', 'date')
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    headers: Dict[str, str]
+    stored_at: float
+    max_age: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('last-modified')
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) - self.stored_at < self.max_age
+
+
+class HTTPCache:
+    """
+    Persistent HTTP response cache backed by SQLite.
+
+    Entries are keyed by normalized URL and hold the decoded body, a subset of
+    the response headers and the validators. Fresh entries (per Cache-Control
+    max-age or Expires) are served without a request; stale ones are
+    revalidated with If-None-Match / If-Modified-Since. Every
+    ``evict_every`` writes, entries older than ``max_entry_age`` and then
+    the oldest ones beyond ``max_bytes`` of bodies are removed.
+
+    All methods block on SQLite; async callers run them in a worker thread.
+    """
+
+    def __init__(self,
+                 path: str = HTTP_CACHE_SETTINGS['path'],
+                 default_ttl: float = HTTP_CACHE_SETTINGS['default_ttl'],
+                 max_bytes: int = HTTP_CACHE_SETTINGS['max_bytes'],
+                 max_entry_age: float = HTTP_CACHE_SETTINGS['max_entry_age'],
+                 evict_every: int = HTTP_CACHE_SETTINGS['evict_every']) -> None:
+        self.logger = LoggerService()
+        self.metrics = MetricsRegistry()
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.max_entry_age = max_entry_age
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')  # With WAL, fsync only at checkpoints
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, body TEXT NOT NULL, headers TEXT NOT NULL, '
+            'stored_at REAL NOT NULL, max_age REAL NOT NULL, size INTEGER NOT NULL DEFAULT 0)'
+        )
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(responses)')}
+        if 'size' not in columns:  # Caches written before eviction existed
+            self._db.execute('ALTER TABLE responses ADD COLUMN size INTEGER NOT NULL DEFAULT 0')
+            self._db.execute('UPDATE responses SET size = length(CAST(body AS BLOB))')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)')
+        self._db.commit()
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Return the stored entry for ``url``, fresh or not, without counting it."""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._db.execute(
+                'SELECT body, headers, stored_at, max_age FROM responses WHERE url = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, headers, stored_at, max_age = row
+        return CacheEntry(key, body, json.loads(headers), stored_at, max_age)
+
+    def fresh(self, url: str) -> Optional[CacheEntry]:
+        """
+        Return the entry if it can be used without contacting the server.
+        Anything else counts as a miss, including entries revalidated later.
+        """
+        entry = self.lookup(url)
+        if entry is not None and entry.is_fresh():
+            self.hits += 1
+            self.metrics.increment('cache_events_total', cache='http', event='hit')
+            self.logger.debug("HTTP cache hit for %s", url)
+            return entry
+        self.misses += 1
+        self.metrics.increment('cache_events_total', cache='http', event='miss')
+        return None
+
+    @staticmethod
+    def validators(headers: Mapping[str, str]) -> Dict[str, str]:
+        """The ETag/Last-Modified of a response, keyed by lowercase header name."""
+        return {
+            name.lower(): value for name, value in headers.items()
+            if name.lower() in ('etag', 'last-modified')
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Request headers that let the server answer 304 for ``entry``."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def store(self, url: str, body: str, headers: Mapping[str, str]) -> None:
+        """Store a full (200) response."""
+        kept = self._kept_headers(headers)
+        if 'no-store' in kept.get('cache-control', '').lower():
+            return
+        self._write(normalize_url(url), body, kept)
+
+    def revalidate(self, url: str, headers: Mapping[str, str]) -> Optional[CacheEntry]:
+        """Handle a 304: refresh the stored entry with the new headers and return it."""
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        self.revalidations += 1
+        self.metrics.increment('cache_events_total', cache='http', event='revalidated')
+        merged = {**entry.headers, **self._kept_headers(headers)}
+        self._write(entry.url, entry.body, merged)
+        self.logger.debug("HTTP cache revalidated %s", url)
+        return self.lookup(url)
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'revalidations': self.revalidations}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _kept_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+        return {
+            name.lower(): value for name, value in headers.items()
+            if name.lower() in STORED_HEADERS
+        }
+
+    def _max_age(self, headers: Dict[str, str], now: float) -> float:
+        cache_control = headers.get('cache-control', '').lower()
+        directives = [d.strip() for d in cache_control.split(',')]
+        if 'no-cache' in directives:
+            return 0.0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return float(directive.split('=', 1)[1])
+                except ValueError:
+                    break
+        if 'expires' in headers:
+            try:
+                return max(0.0, parsedate_to_datetime(headers['expires']).timestamp() - now)
+            except (TypeError, ValueError):
+                return 0.0
+        return float(self.default_ttl)
+
+    def _write(self, key: str, body: str, headers: Dict[str, str]) -> None:
+        now = time.time()
+        size = len(body.encode('utf-8'))
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (url, body, headers, stored_at, max_age, size) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, body, json.dumps(headers), now, self._max_age(headers, now), size)
+            )
+            self._writes += 1
+            if self.evict_every and self._writes % self.evict_every == 0:
+                self._evict(now)
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop entries past ``max_entry_age``, then the oldest beyond ``max_bytes``. Caller holds the lock."""
+        removed = self._db.execute(
+            'DELETE FROM responses WHERE stored_at < ?', (now - self.max_entry_age,)
+        ).rowcount
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total > self.max_bytes:
+            excess, doomed = total - self.max_bytes, []
+            for url, size in self._db.execute('SELECT url, size FROM responses ORDER BY stored_at'):
+                doomed.append((url,))
+                excess -= size
+                if excess <= 0:
+                    break
+            self._db.executemany('DELETE FROM responses WHERE url = ?', doomed)
+            removed += len(doomed)
+        if removed:
+            self.metrics.increment('cache_events_total', removed, cache='http', event='evicted')
+            self.logger.info("HTTP cache evicted %s entries", removed)
@@ -1,20 +1,46 @@
+import atexit
 import logging
-from typing import Protocol
+import logging.handlers
+from typing import Protocol, Union
 import threading
 import queue
 import datetime
 import os
-from abc import ABC, abstractmethod
+from ..config import LOGGING_SETTINGS
 
 class LogObserver(Protocol):
     def on_log_message(self, level: str, message: str, timestamp: str) -> None:
         """Called when a new log message is available."""
         pass
 
+class _ObserverHandler(logging.Handler):
+    """Hands formatted records to a bounded queue; drops them when it is full."""
+
+    def __init__(self, delivery_queue: queue.Queue):
+        super().__init__()
+        self.delivery_queue = delivery_queue
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        timestamp = datetime.datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            self.delivery_queue.put_nowait((record.levelname, record.getMessage(), timestamp))
+        except queue.Full:
+            self.dropped += 1
+
 class LoggerService:
+    """
+    Application logger whose callers never wait on I/O or observers.
+
+    Records go through a QueueHandler to a QueueListener thread, which writes
+    the log file and passes them on to a bounded queue drained by a separate
+    observer delivery thread. A slow observer can therefore only make
+    observer messages drop, never stall the emitting thread. Messages take
+    %-style arguments, which are only formatted when the level is enabled.
+    """
     _instance = None
     _lock = threading.Lock()
-    _log_queue = queue.Queue()
+    _log_queue: queue.Queue = queue.Queue()
     _observers: list[LogObserver] = []
 
     def __new__(cls):
@@ -27,31 +53,61 @@ class LoggerService:
     @classmethod
     def _setup_logger(cls):
         logger = logging.getLogger('URLMarkdown')
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(os.getenv('URL_MARKDOWN_LOG_LEVEL', LOGGING_SETTINGS['level']).upper())
+        logger.propagate = False
 
         # Ensure logs directory exists
-        logs_dir = 'logs'
+        logs_dir = LOGGING_SETTINGS['directory']
         if not os.path.exists(logs_dir):
             os.makedirs(logs_dir)
 
-        # File handler
-        file_handler = logging.FileHandler(os.path.join(logs_dir, 'url_markdown.log'))
+        # File handler, run on the listener thread
+        file_handler = logging.FileHandler(os.path.join(logs_dir, LOGGING_SETTINGS['filename']))
         file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
 
-        # Queue handler
-        queue_handler = logging.Handler()
-        queue_handler.emit = lambda record: cls._handle_log_record(record)
-        logger.addHandler(queue_handler)
+        # Observer handler feeding the delivery thread
+        cls._observer_queue = queue.Queue(maxsize=LOGGING_SETTINGS['observer_queue_size'])
+        cls._observer_handler = _ObserverHandler(cls._observer_queue)
+        cls._delivery_thread = threading.Thread(
+            target=cls._deliver_to_observers, name='LoggerObserverDelivery', daemon=True
+        )
+        cls._delivery_thread.start()
+
+        # Queue handler: the only handler that runs on the emitting thread
+        logger.addHandler(logging.handlers.QueueHandler(cls._log_queue))
+        cls._listener = logging.handlers.QueueListener(
+            cls._log_queue, file_handler, cls._observer_handler, respect_handler_level=True
+        )
+        cls._listener.start()
+        atexit.register(cls.shutdown)
 
         cls.logger = logger
 
     @classmethod
-    def _handle_log_record(cls, record):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        for observer in cls._observers:
-            observer.on_log_message(record.levelname, record.message, timestamp)
+    def _deliver_to_observers(cls):
+        while True:
+            item = cls._observer_queue.get()
+            if item is None:
+                return
+            for observer in list(cls._observers):
+                try:
+                    observer.on_log_message(*item)
+                except Exception:
+                    pass  # A failing observer must not take the others down
+
+    @classmethod
+    def shutdown(cls):
+        """Flush queued records to the file and observers and stop the threads."""
+        listener = getattr(cls, '_listener', None)
+        if listener is None:
+            return
+        cls._listener = None
+        listener.stop()
+        cls._observer_queue.put(None)
+        cls._delivery_thread.join(timeout=1)
+        for handler in listener.handlers:
+            handler.close()
 
     def add_observer(self, observer: LogObserver):
         self._observers.append(observer)
@@ -60,18 +116,29 @@ class LoggerService:
         if observer in self._observers:
             self._observers.remove(observer)
 
-    def debug(self, message: str):
-        self.logger.debug(message)
+    def set_level(self, level: Union[int, str]):
+        self.logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Guard for log arguments that are expensive to compute."""
+        return self.logger.isEnabledFor(level)
+
+    @property
+    def dropped_observer_messages(self) -> int:
+        return self._observer_handler.dropped
+
+    def debug(self, message: str, *args):
+        self.logger.debug(message, *args)
+
+    def info(self, message: str, *args):
+        self.logger.info(message, *args)
 
-    def info(self, message: str):
-        self.logger.info(message)
+    def warning(self, message: str, *args):
+        self.logger.warning(message, *args)
 
-    def warning(self, message: str):
-        self.logger.warning(message)
+    def error(self, message: str, *args):
+        self.logger.error(message, *args)
 
-    def error(self, message: str):
-        self.logger.error(message)
-    
     @classmethod
     def get_logger(cls) -> 'LoggerService':
-        return LoggerService()
\ No newline at end of file
+        return LoggerService()
@@ -0,0 +1,67 @@
+import re
+from typing import Optional
+import lxml.html
+from lxml import etree
+from lxml.html import HtmlElement
+from .html_converter import HTMLConverter
+
+_BODY_TAG = re.compile(r'<body[\s/>]', re.IGNORECASE)
+
+class LxmlHTMLConverter(HTMLConverter):
+    """
+    HTMLConverter engine that parses, cleans and extracts on an lxml tree.
+
+    The selector rules are applied with the same semantics as the
+    BeautifulSoup engine, so both produce the same Markdown for the same
+    page; only parsing and tree walking are faster. That includes fragments
+    without a ``<body>`` tag: lxml adds one, html.parser doesn't, so when no
+    content selector matches such a fragment both engines return "".
+    """
+    engine = 'lxml'
+
+    def _convert(self, html_content: str, document: Optional[HtmlElement] = None) -> str:
+        if document is not None:
+            root = document  # Parsed while the response was streaming in
+        elif not html_content.strip():
+            return ""
+        else:
+            with self._stage('parse'):
+                root = lxml.html.document_fromstring(html_content)
+        with self._stage('clean'):
+            self._clean_content(root)
+        with self._stage('extract'):
+            main_content = self._extract_main_content(root)
+            if main_content.tag == 'body' and not _BODY_TAG.search(html_content):
+                return ""  # The <body> fallback was implied by the parser
+        with self._stage('markdown'):
+            return self.emitter.emit_lxml(main_content)
+
+    def _clean_content(self, root: HtmlElement) -> None:
+        # Collect every match in one traversal
+        matches = self.cleaning_matcher.matches
+        doomed = [
+            element for element in root.iter(etree.Element)
+            if matches(
+                element.tag,
+                ' '.join(element.get('class', '').split()),
+                element.get('id', '')
+            )
+        ]
+        for element in doomed:
+            if element.getparent() is not None:
+                element.drop_tree()
+
+    def _extract_main_content(self, root: HtmlElement) -> HtmlElement:
+        # Find the best-ranked element matching an ID or class selector
+        best, best_rank = None, None
+        for element in root.iter(etree.Element):
+            rank = self.content_matcher.rank(element.get('id', ''), element.get('class', '').split())
+            if rank is not None and (best_rank is None or rank < best_rank):
+                best, best_rank = element, rank
+                if rank == 0:
+                    break
+
+        if best is not None:
+            return best
+        body = root.find('body')  # Fallback to body if no content is found
+        return body if body is not None else root
@@ -0,0 +1,56 @@
+from typing import Optional, TextIO
+from bs4 import BeautifulSoup, Comment, Tag
+from lxml import etree
+from lxml.html import HtmlElement
+from markdownify import MarkdownConverter
+
+class MarkdownEmitter:
+    """
+    Emits Markdown directly from an already-parsed tree.
+
+    ``markdownify(str(element))`` serializes the chosen subtree and parses it
+    a second time. The emitter instead hands the existing tree to
+    markdownify's converter: BeautifulSoup elements are moved into an empty
+    document, and lxml elements are replayed into one through the
+    BeautifulSoup tree-builder callbacks. The output is identical to
+    ``markdownify(str(element), **options)``.
+    """
+
+    def __init__(self, **options) -> None:
+        self._converter = MarkdownConverter(**options)
+
+    def emit(self, element: Optional[Tag], stream: Optional[TextIO] = None) -> str:
+        """Convert a BeautifulSoup element; it is detached from its tree."""
+        document = BeautifulSoup('', 'html.parser')
+        if element is not None:
+            document.append(element.extract())
+        return self._write(self._converter.convert_soup(document), stream)
+
+    def emit_lxml(self, element: HtmlElement, stream: Optional[TextIO] = None) -> str:
+        """Convert an lxml element without serializing it."""
+        document = BeautifulSoup('', 'html.parser')
+        self._replay(element, document)
+        document.endData()
+        return self._write(self._converter.convert_soup(document), stream)
+
+    def _replay(self, element: HtmlElement, document: BeautifulSoup) -> None:
+        tag = element.tag
+        if isinstance(tag, str):
+            document.handle_starttag(tag, None, None, dict(element.attrib))
+            if element.text:
+                document.handle_data(element.text)
+            for child in element:
+                self._replay(child, document)
+                if child.tail:
+                    document.handle_data(child.tail)
+            document.handle_endtag(tag)
+        elif tag is etree.Comment:
+            document.endData()
+            document.handle_data(element.text or '')
+            document.endData(Comment)
+
+    @staticmethod
+    def _write(markdown: str, stream: Optional[TextIO]) -> str:
+        if stream is not None:
+            stream.write(markdown)
+        return markdown
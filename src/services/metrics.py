@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from ..config import METRICS_SETTINGS
+
+LabelSet = Tuple[Tuple[str, str], ...]
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _labels(labels: Dict[str, Any]) -> LabelSet:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelSet, **extra: str) -> str:
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    escaped = (
+        '%s="%s"' % (key, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in pairs
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+class _Timing:
+    """Running count/sum/max plus a bounded reservoir of recent samples for quantiles."""
+
+    __slots__ = ('count', 'total', 'maximum', 'recent')
+
+    def __init__(self, reservoir_size: int) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.recent: Deque[float] = deque(maxlen=reservoir_size)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+        self.recent.append(seconds)
+
+    def quantile(self, fraction: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'max': self.maximum,
+            **{f'p{int(q * 100)}': self.quantile(q) for q in QUANTILES}
+        }
+
+
+class MetricsRegistry:
+    """
+    Process-wide timing spans and counters.
+
+    Spans record durations (in seconds) per metric name and label set;
+    counters are plain monotonically increasing totals. Everything is kept in
+    memory and exposed as a snapshot, JSON or Prometheus text. Worker
+    processes ``drain`` what they recorded and the parent ``merge``s it, so
+    conversions on the process pool still show up per stage.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._setup()
+            return cls._instance
+
+    def _setup(self) -> None:
+        self.enabled = METRICS_SETTINGS['enabled']
+        self.namespace = METRICS_SETTINGS['namespace']
+        self.reservoir_size = METRICS_SETTINGS['reservoir_size']
+        self._data_lock = threading.Lock()
+        self._timings: Dict[str, Dict[LabelSet, _Timing]] = {}
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._started = time.time()
+
+    @classmethod
+    def get_registry(cls) -> 'MetricsRegistry':
+        return MetricsRegistry()
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """Record one duration for ``name``."""
+        if not self.enabled:
+            return
+        key = _labels(labels)
+        with self._data_lock:
+            series = self._timings.setdefault(name, {})
+            timing = series.get(key)
+            if timing is None:
+                timing = series[key] = _Timing(self.reservoir_size)
+            timing.add(seconds)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = _labels(labels)
+        with self._data_lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[None]:
+        """Time the enclosed block, including when it raises."""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def drain(self) -> Dict[str, list]:
+        """Remove and return the recorded samples and counters, as picklable data for ``merge``."""
+        with self._data_lock:
+            drained = {
+                'timings': [
+                    (name, dict(key), list(timing.recent))
+                    for name, series in self._timings.items() for key, timing in series.items()
+                ],
+                'counters': [
+                    (name, dict(key), value)
+                    for name, series in self._counters.items() for key, value in series.items()
+                ]
+            }
+            self._timings.clear()
+            self._counters.clear()
+        return drained
+
+    def merge(self, drained: Dict[str, list]) -> None:
+        """Add samples and counters drained from another registry, e.g. in a worker process."""
+        for name, labels, samples in drained.get('timings', ()):
+            for seconds in samples:
+                self.observe(name, seconds, **labels)
+        for name, labels, value in drained.get('counters', ()):
+            self.increment(name, value, **labels)
+
+    def reset(self) -> None:
+        with self._data_lock:
+            self._timings.clear()
+            self._counters.clear()
+            self._started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-data copy of every timing summary and counter."""
+        with self._data_lock:
+            return {
+                'started': self._started,
+                'timestamp': time.time(),
+                'timings': {
+                    name: [{'labels': dict(key), **timing.summary()} for key, timing in series.items()]
+                    for name, series in self._timings.items()
+                },
+                'counters': {
+                    name: [{'labels': dict(key), 'value': value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                }
+            }
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition: timings as summaries, counters as counters."""
+        lines: List[str] = []
+        with self._data_lock:
+            for name, series in sorted(self._timings.items()):
+                metric = f'{self.namespace}_{name}'
+                lines.append(f'# TYPE {metric} summary')
+                for key, timing in series.items():
+                    for q in QUANTILES:
+                        lines.append(f'{metric}{_format_labels(key, quantile=str(q))} {timing.quantile(q):.6f}')
+                    lines.append(f'{metric}_sum{_format_labels(key)} {timing.total:.6f}')
+                    lines.append(f'{metric}_count{_format_labels(key)} {timing.count}')
+            for name, series in sorted(self._counters.items()):
+                metric = f'{self.namespace}_{name}'
+                lines.append(f'# TYPE {metric} counter')
+                for key, value in series.items():
+                    lines.append(f'{metric}{_format_labels(key)} {value:g}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path: str, fmt: str = 'json') -> None:
+        """Write the current metrics to ``path`` as 'json' or 'prometheus' text."""
+        text = self.to_prometheus() if fmt == 'prometheus' else self.to_json()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
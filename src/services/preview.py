@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import lxml.html
+from lxml.etree import ParserError
+from lxml_html_clean import Cleaner
+
+from ..config import PREVIEW_SETTINGS
+
+# What QTextBrowser can't use anyway: scripts, styles, embeds, forms and vector art
+_cleaner = Cleaner(
+    scripts=True,
+    javascript=True,
+    comments=True,
+    style=True,
+    inline_style=True,
+    links=True,
+    meta=True,
+    processing_instructions=True,
+    embedded=True,
+    frames=True,
+    forms=True,
+    annoying_tags=True,
+    page_structure=False,
+    kill_tags=['svg', 'noscript', 'template', 'canvas'],
+    safe_attrs_only=True
+)
+
+
+@dataclass
+class PreviewText:
+    """
+    A preview-ready document; ``truncated`` is set when it was cut at ``limit``
+    characters. ``shown_size`` of the ``original_size`` characters are shown.
+    """
+    text: str
+    original_size: int
+    truncated: bool = False
+    shown_size: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.shown_size is None:
+            self.shown_size = len(self.text)
+
+
+def truncate(text: str, limit: int) -> PreviewText:
+    """Cut ``text`` to at most ``limit`` characters, at a line break where possible."""
+    if len(text) <= limit:
+        return PreviewText(text, len(text))
+    cut = text.rfind('\n', 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return PreviewText(text[:cut], len(text), truncated=True)
+
+
+def sanitize_html(html_content: str, limit: Optional[int] = PREVIEW_SETTINGS['max_html_chars']) -> PreviewText:
+    """
+    Prepare a page for QTextBrowser: strip scripts, styles and other markup
+    the preview can't render, then truncate what is left to ``limit``
+    characters (None for no limit). Sizes refer to the sanitized document.
+    Meant to run off the GUI thread.
+    """
+    try:
+        root = _cleaner.clean_html(lxml.html.document_fromstring(html_content))
+    except (ParserError, ValueError):
+        return PreviewText("", 0)
+    text = lxml.html.tostring(root, encoding='unicode')
+    return truncate(text, len(text) if limit is None else limit)
+
+
+def iter_chunks(text: str, size: int = PREVIEW_SETTINGS['chunk_chars']) -> Iterator[str]:
+    """Yield consecutive pieces of ``text`` of about ``size`` characters, split after line breaks."""
+    start = 0
+    while start < len(text):
+        end = start + size
+        if end < len(text):
+            newline = text.rfind('\n', start, end)
+            if newline > start:
+                end = newline + 1
+        yield text[start:end]
+        start = end
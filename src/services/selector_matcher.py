@@ -0,0 +1,77 @@
+import re
+from typing import Dict, List, Optional, Pattern, Sequence
+
+
+def _substring_pattern(needles: Sequence[str]) -> Optional[Pattern]:
+    """Compile literal needles into one alternation, longest first."""
+    if not needles:
+        return None
+    ordered = sorted(set(needles), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(needle) for needle in ordered))
+
+
+class CleaningMatcher:
+    """
+    CLEANING_SELECTORS compiled into a single element predicate.
+
+    Unwanted tags become a set lookup; class and id substrings become one
+    regular-expression alternation each, scanned in C, so the cost per
+    element does not grow with the number of rules. Matching is done against
+    the lowercased attribute value, exactly like the original per-rule
+    ``find_all`` lambdas.
+    """
+
+    def __init__(self, selectors: Dict[str, List[str]]) -> None:
+        self.tags = frozenset(selectors['unwanted_tags'])
+        self._class_pattern = _substring_pattern(selectors['common_classes'])
+        self._id_pattern = _substring_pattern(selectors['common_ids'])
+
+    def matches(self, tag: str, class_attr: str, id_attr: str) -> bool:
+        """
+        Args:
+            tag: Lowercase tag name
+            class_attr: Class tokens joined by single spaces ("" if absent)
+            id_attr: The id attribute ("" if absent)
+        """
+        if tag in self.tags:
+            return True
+        if class_attr and self._class_pattern and self._class_pattern.search(class_attr.lower()):
+            return True
+        if id_attr and self._id_pattern and self._id_pattern.search(id_attr.lower()):
+            return True
+        return False
+
+
+class ContentMatcher:
+    """
+    CONTENT_SELECTORS compiled into a ranking function.
+
+    Every id rule outranks every class rule, and earlier rules outrank later
+    ones, reproducing the original lookup order while letting the caller find
+    the best element in one traversal. Rank 0 is the best possible match.
+    """
+
+    def __init__(self, selectors: Dict[str, List[str]]) -> None:
+        self._ids = list(selectors['ids'])
+        self._id_pattern = _substring_pattern(self._ids)
+        self._class_ranks: Dict[str, int] = {}
+        for offset, class_name in enumerate(selectors['classes']):
+            self._class_ranks.setdefault(class_name, len(self._ids) + offset)
+
+    def rank(self, id_attr: str, class_tokens: Sequence[str]) -> Optional[int]:
+        """Return the best rank the element qualifies for, or None."""
+        if id_attr and self._id_pattern:
+            id_lower = id_attr.lower()
+            if self._id_pattern.search(id_lower):
+                return next(i for i, content_id in enumerate(self._ids) if content_id in id_lower)
+
+        best = None
+        if class_tokens:
+            candidates = list(class_tokens)
+            if len(candidates) > 1:
+                candidates.append(' '.join(class_tokens))
+            for token in candidates:
+                rank = self._class_ranks.get(token)
+                if rank is not None and (best is None or rank < best):
+                    best = rank
+        return best
@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from ..config import INCREMENTAL_SETTINGS
+from ..interfaces.scraper import IScraper
+from .logger import LoggerService
+from .url_utils import normalize_url
+
+_parser = etree.XMLParser(resolve_entities=False, no_network=True, recover=True, huge_tree=True)
+
+
+def parse_lastmod(value: Optional[str]) -> Optional[float]:
+    """Timestamp of a W3C datetime (``2024-05-01`` or ``2024-05-01T10:00:00+00:00``); None if invalid."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def parse_sitemap(xml: str) -> Tuple[Dict[str, Optional[float]], List[str]]:
+    """
+    Parse a sitemap or sitemap index.
+
+    Returns:
+        Tuple of ({normalized page URL: lastmod timestamp or None}, [nested sitemap URLs])
+    """
+    try:
+        root = etree.fromstring(xml.encode('utf-8'), _parser)
+    except (etree.XMLSyntaxError, ValueError):
+        return {}, []
+    if root is None:
+        return {}, []
+
+    pages: Dict[str, Optional[float]] = {}
+    sitemaps: List[str] = []
+    for element in root:
+        if not isinstance(element.tag, str):
+            continue  # Comments and processing instructions
+        tag = etree.QName(element).localname
+        fields = {
+            etree.QName(child).localname: (child.text or '').strip()
+            for child in element if isinstance(child.tag, str)
+        }
+        if not fields.get('loc'):
+            continue
+        if tag == 'url':
+            pages[normalize_url(fields['loc'])] = parse_lastmod(fields.get('lastmod'))
+        elif tag == 'sitemap':
+            sitemaps.append(fields['loc'])
+    return pages, sitemaps
+
+
+async def load_sitemap(scraper: IScraper,
+                       url: str,
+                       max_sitemaps: int = INCREMENTAL_SETTINGS['max_sitemaps']) -> Dict[str, Optional[float]]:
+    """Fetch ``url`` and the sitemaps it indexes; returns {normalized page URL: lastmod timestamp}."""
+    logger = LoggerService()
+    pages: Dict[str, Optional[float]] = {}
+    pending, visited = [url], set()
+    while pending and len(visited) < max_sitemaps:
+        sitemap_url = pending.pop(0)
+        if sitemap_url in visited:
+            continue
+        visited.add(sitemap_url)
+        fetched = await scraper.fetch_detailed(sitemap_url)
+        if not fetched.ok:
+            logger.warning("Could not fetch sitemap %s", sitemap_url)
+            continue
+        found, nested = parse_sitemap(fetched.content)
+        pages.update(found)
+        pending.extend(nested)
+    logger.info("Read %s URLs from %s sitemap(s)", len(pages), len(visited))
+    return pages
@@ -0,0 +1,130 @@
+import json
+import os
+import random
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from ..config import STRATEGY_STORE_SETTINGS
+from .logger import LoggerService
+
+
+class DomainStrategyStore:
+    """
+    Learns, per domain, how well each fetch tier works.
+
+    For every (domain, tier) pair the store keeps the number of attempts and
+    exponentially weighted moving averages of the success rate and of the
+    latency of successful fetches. ``order_tiers`` uses these to put the
+    cheapest reliable tier first and to skip tiers that keep failing, with an
+    occasional re-probe so a skipped tier can recover.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = STRATEGY_STORE_SETTINGS['path'],
+                 min_attempts: int = STRATEGY_STORE_SETTINGS['min_attempts'],
+                 skip_below_success_rate: float = STRATEGY_STORE_SETTINGS['skip_below_success_rate'],
+                 reprobe_probability: float = STRATEGY_STORE_SETTINGS['reprobe_probability'],
+                 smoothing: float = STRATEGY_STORE_SETTINGS['smoothing'],
+                 save_every: int = STRATEGY_STORE_SETTINGS['save_every']) -> None:
+        self.logger = LoggerService()
+        self.path = path
+        self.min_attempts = min_attempts
+        self.skip_below_success_rate = skip_below_success_rate
+        self.reprobe_probability = reprobe_probability
+        self.smoothing = smoothing
+        self.save_every = save_every
+        self._domains: Dict[str, Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.load()
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._domains = json.load(f)
+            self.logger.info("Loaded fetch strategy for %s domains", len(self._domains))
+        except (OSError, ValueError) as e:
+            self.logger.error("Failed to load fetch strategy store: %s", e)
+            self._domains = {}
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._domains, indent=2, sort_keys=True)
+            self._unsaved = 0
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.error("Failed to save fetch strategy store: %s", e)
+
+    def record(self, url: str, tier: str, success: bool, latency: float) -> None:
+        """Record the outcome of one tier attempt for the URL's domain."""
+        domain = self.domain_of(url)
+        if not domain:
+            return
+        with self._lock:
+            stats = self._domains.setdefault(domain, {}).setdefault(
+                tier, {'attempts': 0, 'success_rate': 0.0, 'latency': None}
+            )
+            if stats['attempts'] == 0:
+                stats['success_rate'] = 1.0 if success else 0.0
+            else:
+                stats['success_rate'] += self.smoothing * ((1.0 if success else 0.0) - stats['success_rate'])
+            stats['attempts'] += 1
+            if success:
+                previous = stats['latency']
+                stats['latency'] = latency if previous is None else previous + self.smoothing * (latency - previous)
+            self._unsaved += 1
+            should_save = self.save_every and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+
+    def order_tiers(self, url: str, tiers: List[str]) -> List[str]:
+        """
+        Return the tier names to try for ``url``, best first.
+
+        Trusted tiers that succeed are ordered by expected cost (latency
+        divided by success rate), followed by untried tiers in their default
+        order. Trusted tiers that mostly fail are dropped, except that one of
+        them is occasionally moved to the front to re-probe it. If every tier
+        is failing, all of them are returned in their default order.
+        """
+        with self._lock:
+            known = dict(self._domains.get(self.domain_of(url), {}))
+
+        reliable, untried, failing = [], [], []
+        for index, tier in enumerate(tiers):
+            stats = known.get(tier)
+            if not stats or stats['attempts'] < self.min_attempts:
+                untried.append(tier)
+            elif stats['success_rate'] < self.skip_below_success_rate:
+                failing.append(tier)
+            else:
+                cost = (stats['latency'] or 0.0) / max(stats['success_rate'], 1e-6)
+                reliable.append((cost, index, tier))
+
+        ordered = [tier for _, _, tier in sorted(reliable)] + untried
+        if not ordered:
+            # Everything has been failing; fall back to trying every tier
+            return list(tiers)
+        if failing and random.random() < self.reprobe_probability:
+            probe = random.choice(failing)
+            self.logger.debug("Re-probing %s for %s", probe, self.domain_of(url))
+            ordered.insert(0, probe)
+        return ordered
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        with self._lock:
+            return json.loads(json.dumps(self._domains))
@@ -0,0 +1,102 @@
+import codecs
+import time
+from typing import List, Mapping, Optional
+
+import lxml.html
+from lxml.html import HtmlElement
+
+from ..config import STREAMING_SETTINGS, DECODING_SETTINGS
+from .decoding import ContentDecoder, resolve_encoding
+
+
+class StreamingDocument:
+    """
+    Incrementally consumes a response body under a hard size budget.
+
+    Each chunk is decoded with an incremental decoder and, when ``parse`` is
+    set, fed to lxml's feed parser straight away, so parsing overlaps with
+    the download and no second full copy of the body is made. Input beyond
+    ``max_bytes`` is discarded and the document is marked truncated.
+
+    The charset is resolved from the first ``sniff_bytes`` of the body (BOM,
+    Content-Type, ``<meta charset>``, detection as a last resort); br/zstd
+    bodies the HTTP client left compressed are decompressed first. Time spent
+    decoding and parsing is accumulated in ``decode_seconds`` and
+    ``parse_seconds``.
+    """
+
+    def __init__(self,
+                 headers: Optional[Mapping[str, str]] = None,
+                 max_bytes: int = STREAMING_SETTINGS['max_document_bytes'],
+                 parse: bool = STREAMING_SETTINGS['incremental_parse'],
+                 transport: str = 'aiohttp') -> None:
+        self.headers = headers if headers is not None else {}
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.truncated = False
+        self.encoding: Optional[str] = None
+        self.decode_seconds = 0.0
+        self.parse_seconds = 0.0
+        self._content_decoder = ContentDecoder(self.headers, transport)
+        self._decoder = None  # Created once the charset is known
+        self._head: List[bytes] = []
+        self._parser = lxml.html.HTMLParser() if parse else None
+        self._parts: list[str] = []
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume a chunk; returns False once the size budget is exhausted."""
+        if self._content_decoder.active:
+            started = time.perf_counter()
+            chunk = self._content_decoder.decompress(chunk)
+            self.decode_seconds += time.perf_counter() - started
+        remaining = self.max_bytes - self.size
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+        self.size += len(chunk)
+
+        if self._decoder is not None:
+            self._push(self._decode(chunk))
+        else:
+            # Hold back the first bytes until there are enough to sniff the charset
+            self._head.append(chunk)
+            if self.size >= DECODING_SETTINGS['sniff_bytes'] or self.truncated:
+                self._start_decoding()
+        return not self.truncated
+
+    def close(self) -> tuple[str, Optional[HtmlElement]]:
+        """Finish decoding and parsing; returns ``(text, root element or None)``."""
+        if self._decoder is None:
+            self._start_decoding()
+        self._push(self._decode(b'', final=True))
+        text = ''.join(self._parts)
+        self._parts = [text]
+        root = None
+        if self._parser is not None and text.strip():
+            started = time.perf_counter()
+            root = self._parser.close()
+            self.parse_seconds += time.perf_counter() - started
+        return text, root
+
+    def _start_decoding(self) -> None:
+        started = time.perf_counter()
+        head = b''.join(self._head)
+        self._head = []
+        self.encoding = resolve_encoding(head, self.headers)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        self.decode_seconds += time.perf_counter() - started
+        self._push(self._decode(head))
+
+    def _decode(self, chunk: bytes, final: bool = False) -> str:
+        started = time.perf_counter()
+        text = self._decoder.decode(chunk, final)
+        self.decode_seconds += time.perf_counter() - started
+        return text
+
+    def _push(self, text: str) -> None:
+        if text:
+            self._parts.append(text)
+            if self._parser is not None:
+                started = time.perf_counter()
+                self._parser.feed(text)
+                self.parse_seconds += time.perf_counter() - started
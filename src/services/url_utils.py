@@ -0,0 +1,31 @@
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, quote, urlencode
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent spellings map to the same key.
+
+    Lowercases the scheme and host, drops default ports and the fragment,
+    uses ``/`` for an empty path and sorts the query parameters (re-encoded
+    with ``%20`` for spaces, as browsers send them).
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    path = parts.path or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)), quote_via=quote)
+    try:
+        port = parts.port
+    except ValueError:  # Malformed port; keep the authority as written
+        return urlunsplit((scheme, parts.netloc, path, query, ""))
+
+    host = (parts.hostname or "").lower()
+    if ':' in host:
+        host = f"[{host}]"  # IPv6 literal
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username + (f":{parts.password}" if parts.password else "")
+        host = f"{userinfo}@{host}"
+    return urlunsplit((scheme, host, path, query, ""))
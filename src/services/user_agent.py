@@ -1,6 +1,8 @@
 import requests
+import time
 from .logger import LoggerService
 from ..interfaces.user_agent import UserAgentServiceInterface
+from ..config import USER_AGENT_SETTINGS
 import os
 from dotenv import load_dotenv
 
@@ -19,18 +21,31 @@ class UserAgentService(UserAgentServiceInterface):
             "linux": "true",
             "mac": "true"
         }
-    
+        self.timeout = USER_AGENT_SETTINGS['api_timeout']
+        self.cache_ttl = USER_AGENT_SETTINGS['api_cache_ttl']
+        self._cached: tuple[str, float] | None = None
+
     def get_user_agent(self) -> str | None:
+        """Return a user agent, reusing the last one fetched within ``cache_ttl`` seconds."""
+        if self._cached is not None and time.monotonic() - self._cached[1] < self.cache_ttl:
+            return self._cached[0]
+        user_agent = self.fetch_user_agent()
+        if user_agent is not None:
+            self._cached = (user_agent, time.monotonic())
+        return user_agent
+
+    def fetch_user_agent(self) -> str | None:
+        """Request a new user agent from the API, bypassing the cache."""
         try:
-            self.logger.info(f"Fetching user agent from {self.api_url}")
-            response = requests.get(self.api_url, headers=self.headers, params=self.params)
+            self.logger.info("Fetching user agent from %s", self.api_url)
+            response = requests.get(self.api_url, headers=self.headers, params=self.params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             user_agent = data.get("ua")
-            self.logger.info(f"Successfully fetched user agent: {user_agent}")
+            self.logger.info("Successfully fetched user agent: %s", user_agent)
             return user_agent
         except requests.RequestException as e:
-            self.logger.error(f"Failed to fetch user agent: {e}")
+            self.logger.error("Failed to fetch user agent: %s", e)
             return None
 
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlparse
+
+from ..config import USER_AGENT_SETTINGS
+from .logger import LoggerService
+
+# Used until the first refresh has filled the cache file
+BUILTIN_USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+]
+
+_CHROME_VERSION = re.compile(r'Chrome/(\d+)')
+_EDGE_VERSION = re.compile(r'Edg/(\d+)')
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """A user agent together with the request headers that browser actually sends."""
+    user_agent: str
+    family: str
+    headers: Dict[str, str] = field(hash=False)
+
+
+def _platform(user_agent: str) -> str:
+    if 'Windows' in user_agent:
+        return 'Windows'
+    if 'Macintosh' in user_agent:
+        return 'macOS'
+    if 'CrOS' in user_agent:
+        return 'Chrome OS'
+    return 'Linux'
+
+
+def make_profile(user_agent: str) -> Optional[BrowserProfile]:
+    """Build the matching header set; None for agents outside the supported families."""
+    if 'Mobile' in user_agent or 'Android' in user_agent:
+        return None  # Mobile layouts convert poorly
+
+    headers = {'User-Agent': user_agent, 'Upgrade-Insecure-Requests': '1'}
+    fetch_metadata = {
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1'
+    }
+    chrome = _CHROME_VERSION.search(user_agent)
+    if chrome:
+        edge = _EDGE_VERSION.search(user_agent)
+        family = 'edge' if edge else 'chrome'
+        brand = f'"Microsoft Edge";v="{edge.group(1)}"' if edge else f'"Google Chrome";v="{chrome.group(1)}"'
+        headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,'
+                      'image/apng,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Sec-CH-UA': f'"Chromium";v="{chrome.group(1)}", {brand}, "Not-A.Brand";v="99"',
+            'Sec-CH-UA-Mobile': '?0',
+            'Sec-CH-UA-Platform': f'"{_platform(user_agent)}"',
+            **fetch_metadata
+        })
+    elif 'Firefox/' in user_agent:
+        family = 'firefox'
+        headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            **fetch_metadata
+        })
+    elif 'Safari/' in user_agent and 'Version/' in user_agent:
+        family = 'safari'
+        headers.update({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9'
+        })
+    else:
+        return None
+    return BrowserProfile(user_agent, family, headers)
+
+
+class UserAgentPool:
+    """
+    Rotating set of browser profiles backed by a local cache file.
+
+    ``next`` only reads memory: it hands out profiles round-robin, either per
+    request or sticky per domain. When the cache is missing or older than
+    ``max_age``, a background thread collects fresh agents (from
+    fake-useragent's bundled data and, if configured, the user agent API),
+    swaps them in and rewrites the file.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = USER_AGENT_SETTINGS['path'],
+                 rotation: str = USER_AGENT_SETTINGS['rotation'],
+                 pool_size: int = USER_AGENT_SETTINGS['pool_size'],
+                 max_age: float = USER_AGENT_SETTINGS['max_age']) -> None:
+        self.logger = LoggerService()
+        self.path = path
+        self.rotation = rotation
+        self.pool_size = pool_size
+        self.max_age = max_age
+        self.fetched_at = 0.0
+        self._profiles: List[BrowserProfile] = []
+        self._by_domain: Dict[str, BrowserProfile] = {}
+        self._index = 0
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.load()
+        self._refresh_if_stale()
+
+    def load(self) -> None:
+        agents, fetched_at = [], 0.0
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                agents, fetched_at = data.get('agents', []), float(data.get('fetched_at', 0))
+            except (OSError, ValueError) as e:
+                self.logger.error("Failed to load user agent cache: %s", e)
+        if not self._install(agents, fetched_at):
+            self._install(BUILTIN_USER_AGENTS, 0.0)
+        self.logger.info("Loaded %s user agents", len(self._profiles))
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps({
+                'fetched_at': self.fetched_at,
+                'agents': [profile.user_agent for profile in self._profiles]
+            }, indent=2)
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.error("Failed to save user agent cache: %s", e)
+
+    def next(self, url: Optional[str] = None, families: Optional[Sequence[str]] = None) -> BrowserProfile:
+        """
+        Profile for the next request to ``url``.
+
+        Args:
+            url: Target URL; used as the key in per-domain rotation
+            families: Restrict to these browser families, e.g. ('chrome',)
+                when the agent is applied to a real Chromium
+        """
+        self._refresh_if_stale()
+        domain = (urlparse(url).hostname or "").lower() if url and self.rotation == 'domain' else None
+        with self._lock:
+            if domain is not None:
+                profile = self._by_domain.get(domain)
+                if profile is not None and (not families or profile.family in families):
+                    return profile
+            candidates = [p for p in self._profiles if not families or p.family in families] or self._profiles
+            profile = candidates[self._index % len(candidates)]
+            self._index += 1
+            if domain is not None:
+                self._by_domain[domain] = profile
+            return profile
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Give a running refresh a moment to finish, so short runs still fill the cache."""
+        thread = self._refresh_thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+
+    def _install(self, agents: Sequence[str], fetched_at: float) -> bool:
+        profiles = [profile for profile in map(make_profile, dict.fromkeys(agents)) if profile is not None]
+        if not profiles:
+            return False
+        with self._lock:
+            self._profiles = profiles[:self.pool_size]
+            self._by_domain.clear()
+            self.fetched_at = fetched_at
+        return True
+
+    def _refresh_if_stale(self) -> None:
+        if time.time() - self.fetched_at < self.max_age:
+            return
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._refresh, name='UserAgentRefresh', daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh(self) -> None:
+        installed = False
+        try:
+            installed = self._install(self._collect_agents(), time.time())
+            if installed:
+                self.logger.info("Refreshed user agent pool with %s agents", len(self._profiles))
+                self.save()
+            else:
+                self.logger.warning("User agent refresh found no usable agents; keeping the current pool")
+        except Exception as e:
+            self.logger.error("User agent refresh failed; keeping the current pool: %s", e)
+        finally:
+            if not installed:
+                with self._lock:
+                    self.fetched_at = time.time()  # Don't retry on every request
+
+    def _collect_agents(self) -> List[str]:
+        agents: List[str] = []
+        try:
+            from fake_useragent import UserAgent
+            # Browser names differ between fake-useragent releases; make_profile filters instead
+            ua = UserAgent()
+            for _ in range(self.pool_size * 3):
+                agents.append(ua.random)
+        except Exception as e:
+            self.logger.error("fake-useragent refresh failed: %s", e)
+
+        if os.getenv('USER_AGENT_API_KEY'):
+            from .user_agent import UserAgentService
+            service = UserAgentService()
+            for _ in range(USER_AGENT_SETTINGS['api_agents']):
+                if (agent := service.fetch_user_agent()) is not None:
+                    agents.append(agent)
+        return agents
@@ -1,150 +1,314 @@
 import requests
-from requests_html import AsyncHTMLSession
-import cloudscraper
+import aiohttp
 import anyio
-from fake_useragent import UserAgent
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from functools import cached_property, partial
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from playwright.async_api import async_playwright
-from ..interfaces.scraper import IScraper
-from typing import Tuple
+from ..interfaces.scraper import IScraper, FetchResult
+from typing import Awaitable, Callable, List, Optional, Tuple
+from ..config import (
+    HTTP_SETTINGS, FETCH_STRATEGY, STRATEGY_STORE_SETTINGS, HTTP_CACHE_SETTINGS, STREAMING_SETTINGS
+)
 from .logger import LoggerService
-import multiprocessing
-from cachetools import TTLCache, cached
-from contextlib import asynccontextmanager
+from .metrics import MetricsRegistry
+from .strategy_store import DomainStrategyStore
+from .http_cache import CacheEntry, HTTPCache
+from .streaming import StreamingDocument
+from .decoding import accept_encoding, decode_body
+from .fetch_scheduler import parse_retry_after
+from .user_agent_pool import BrowserProfile, UserAgentPool
+import time
+from cachetools import TTLCache
+
+CHROMIUM_FAMILIES = ('chrome', 'edge')  # Agents that match the browsers driven by Selenium and Playwright
+FetchTier = Tuple[Callable[[str], Awaitable[FetchResult]], str, float]  # (method, name, timeout in seconds)
+_CHALLENGE_STATUSES = (403, 503)  # Anti-bot pages; a heavier tier may get past them
+
 
 class WebScraper(IScraper):
-    def __init__(self):
+    def __init__(self,
+                 fetch_mode: str = FETCH_STRATEGY['mode'],
+                 hedge_delay: float = FETCH_STRATEGY['hedge_delay'],
+                 parse_documents: bool = STREAMING_SETTINGS['incremental_parse']):
         self.logger = LoggerService()
-        try:
-            self.ua = UserAgent(browsers=['chrome', 'edge', 'firefox'])
-            self.logger.info("Initialized fake-useragent with browser profiles")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize fake-useragent: {str(e)}")
-            self.ua = None
-        self.session = self._create_session()
-        self.html_session = AsyncHTMLSession()
-        self.cloudscraper = cloudscraper.create_scraper(
+        self.metrics = MetricsRegistry()
+        self.fetch_mode = fetch_mode
+        self.hedge_delay = hedge_delay
+        self.parse_documents = parse_documents
+        self.logger.info("WebScraper initialized; fetch backends start on first use")
+        self.cache = TTLCache(maxsize=100, ttl=3600)  # 1 hour cache
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self.strategy_store = DomainStrategyStore() if STRATEGY_STORE_SETTINGS['enabled'] else None
+        self.http_cache = HTTPCache() if HTTP_CACHE_SETTINGS['enabled'] else None
+
+    # Fetch backends: each is imported and built the first time a tier needs it,
+    # so startup doesn't pay for browsers, pyppeteer or the user agent pool.
+
+    def _backend_started(self, name: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        self.metrics.observe('backend_init_seconds', elapsed, backend=name)
+        self.logger.info("Started %s backend in %.3fs", name, elapsed)
+
+    def _is_started(self, backend: str) -> bool:
+        return backend in self.__dict__  # cached_property stores the value here
+
+    @cached_property
+    def user_agents(self) -> UserAgentPool:
+        started = time.perf_counter()
+        pool = UserAgentPool()
+        self._backend_started('user-agent pool', started)
+        return pool
+
+    @cached_property
+    def session(self) -> requests.Session:
+        return self._create_session()
+
+    @cached_property
+    def html_session(self):
+        started = time.perf_counter()
+        from requests_html import AsyncHTMLSession
+        html_session = AsyncHTMLSession()
+        self._backend_started('requests-html', started)
+        return html_session
+
+    @cached_property
+    def cloudscraper(self):
+        started = time.perf_counter()
+        import cloudscraper
+        scraper = cloudscraper.create_scraper(
             browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
         )
-        self.executor = ThreadPoolExecutor(max_workers=3)
-        self.logger.info("WebScraper initialized with concurrent execution capability")
-        self.cache = TTLCache(maxsize=100, ttl=3600)  # 1 hour cache
-        self.process_pool = multiprocessing.Pool(processes=2)
-        self.connection_pool = {
-            'http': requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20),
-            'https': requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
-        }
-        
+        self._backend_started('cloudscraper', started)
+        return scraper
+
+    @cached_property
+    def browser_pool(self):
+        started = time.perf_counter()
+        from .browser_pool import PlaywrightBrowserPool
+        pool = PlaywrightBrowserPool()
+        self._backend_started('playwright', started)
+        return pool
+
+    @cached_property
+    def driver_pool(self):
+        started = time.perf_counter()
+        from .driver_pool import SeleniumDriverPool
+        pool = SeleniumDriverPool()
+        self._backend_started('selenium', started)
+        return pool
+
     def _create_session(self):
         session = requests.Session()
         retry = Retry(
             total=3,
             backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504]
+            status_forcelist=[500, 502, 503, 504],
+            # Hand Retry-After back to the caller (FetchScheduler) instead of sleeping in a worker thread
+            respect_retry_after_header=False,
+            raise_on_status=False
         )
         adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
         session.mount('http://', adapter)
         session.mount('https://', adapter)
-        self.logger.debug(f"Created session with retry config: {retry.__dict__}")
+        self.logger.debug("Created session with retry config: %s", retry.__dict__)
         return session
 
-    @lru_cache(maxsize=1)
-    def _get_random_user_agent(self) -> str:
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use.
+
+        The session must be created inside a running event loop, so it is
+        built lazily rather than in ``__init__``.
+        """
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_SETTINGS['connection_limit'],
+                limit_per_host=HTTP_SETTINGS['connection_limit_per_host'],
+                keepalive_timeout=HTTP_SETTINGS['keepalive_timeout'],
+                use_dns_cache=True,
+                ttl_dns_cache=HTTP_SETTINGS['dns_cache_ttl']
+            )
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=HTTP_SETTINGS['timeout'])
+            )
+            self.logger.debug("Created aiohttp session with settings: %s", HTTP_SETTINGS)
+        return self._http_session
+
+    def _browser_profile(self, url: str, families: Optional[Tuple[str, ...]] = None) -> BrowserProfile:
+        """User agent and matching headers for the next request to ``url``."""
+        profile = self.user_agents.next(url, families)
+        self.logger.debug("Using user agent: %s", profile.user_agent)
+        return profile
+
+    async def _cached_entry(self, url: str) -> Optional[CacheEntry]:
+        """Stored HTTP cache entry for ``url``, read off the event loop."""
+        if self.http_cache is None:
+            return None
+        return await anyio.to_thread.run_sync(self.http_cache.lookup, url)
+
+    def _store_in_http_cache(self, url: str, content: str, headers) -> None:
+        if self.http_cache is not None and content:
+            self.http_cache.store(url, content, headers)
+
+    def _new_document(self, headers, transport: str) -> StreamingDocument:
+        return StreamingDocument(headers, parse=self.parse_documents, transport=transport)
+
+    def _finish_document(self, url: str, document: StreamingDocument, headers) -> FetchResult:
+        """Complete a streamed body and store it in the HTTP cache (blocking)."""
+        content, root = document.close()
+        self.metrics.observe('decode_seconds', document.decode_seconds)
+        if root is not None:
+            self.metrics.observe('convert_stage_seconds', document.parse_seconds, engine='lxml', stage='stream_parse')
+        if document.truncated:
+            self.logger.warning("Response truncated at %s bytes: %s", document.max_bytes, url)
+        else:
+            self._store_in_http_cache(url, content, headers)
+        return FetchResult(
+            url, content, document=root, truncated=document.truncated,
+            validators=HTTPCache.validators(headers)
+        )
+
+    def _throttled(self, url: str, status: int, headers) -> Optional[FetchResult]:
+        """A FetchResult carrying the refusal when the server rate-limited us, else None."""
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if status == 429 or (status == 503 and retry_after is not None):
+            self.logger.warning("%s answered %s, Retry-After: %s", url, status, headers.get('Retry-After'))
+            return FetchResult(url, status=status, retry_after=retry_after)
+        return None
+
+    async def _fetch_with_aiohttp(self, url: str) -> FetchResult:
+        self.logger.info("Starting aiohttp fetch process...")
         try:
-            if self.ua:
-                agent = self.ua.random
-                self.logger.debug(f"Generated random user agent: {agent}")
-                return agent
+            headers = {
+                **self._browser_profile(url).headers,
+                'Accept-Encoding': accept_encoding('aiohttp')
+            }
+            cached_entry = await self._cached_entry(url)
+            headers.update(HTTPCache.conditional_headers(cached_entry))
+
+            session = self._get_http_session()
+            async with session.get(url, headers=headers) as response:
+                self.logger.debug("aiohttp status: %s", response.status)
+                if response.status == 304 and cached_entry is not None:
+                    await anyio.to_thread.run_sync(self.http_cache.revalidate, url, response.headers)
+                    self.logger.info("aiohttp revalidated cached content (304)")
+                    return FetchResult(
+                        url, cached_entry.body, validators=HTTPCache.validators(cached_entry.headers)
+                    )
+                if throttled := self._throttled(url, response.status, response.headers):
+                    return throttled
+                if response.status >= 400:
+                    self.logger.error("aiohttp request failed with status %s", response.status)
+                    return FetchResult(url, status=response.status)
+
+                # Decode and parse chunks as they arrive, up to the size budget
+                document = self._new_document(response.headers, 'aiohttp')
+                async for chunk in response.content.iter_chunked(STREAMING_SETTINGS['chunk_size']):
+                    if not document.feed(chunk):
+                        break
+
+            # Finishing the parse and writing the cache entry are blocking
+            result = await anyio.to_thread.run_sync(self._finish_document, url, document, response.headers)
+            self.logger.info("aiohttp request successful, content length: %s characters", len(result.content))
+            return result
         except Exception as e:
-            self.logger.error(f"Error generating user agent: {str(e)}")
-        
-        # Fallback user agent if fake-useragent fails
-        fallback = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        self.logger.debug(f"Using fallback user agent: {fallback}")
-        return fallback
-
-    @asynccontextmanager
-    async def _browser_context(self):
-        browser = None
+            self.logger.error("aiohttp request failed with error type: %s", type(e).__name__)
+            self.logger.error("aiohttp error details: %s", e)
+            return FetchResult(url)
+
+    def _read_streamed_response(self, url: str, response) -> FetchResult:
+        """Read a ``stream=True`` requests response in chunks (blocking)."""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
-                yield browser
+            document = self._new_document(response.headers, 'requests')
+            for chunk in response.iter_content(chunk_size=STREAMING_SETTINGS['chunk_size']):
+                if not document.feed(chunk):
+                    break
+            return self._finish_document(url, document, response.headers)
         finally:
-            if browser:
-                await browser.close()
+            response.close()
 
-    @cached(cache=TTLCache(maxsize=100, ttl=3600))
-    async def _fetch_with_requests(self, url: str) -> Tuple[str, str]:
+    async def _fetch_with_requests(self, url: str) -> FetchResult:
         try:
             headers = {
-                'User-Agent': self._get_random_user_agent(),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
+                **self._browser_profile(url).headers,
+                'Accept-Encoding': accept_encoding('requests'),
                 'Cache-Control': 'no-cache',
                 'Pragma': 'no-cache'
             }
-            self.logger.debug(f"Request headers: {headers}")
+            cached_entry = await self._cached_entry(url)
+            headers.update(HTTPCache.conditional_headers(cached_entry))
+            self.logger.debug("Request headers: %s", headers)
             
             # Try cloudscraper first
             try:
                 self.logger.info("Attempting cloudscraper request...")
-                response = self.cloudscraper.get(url, headers=headers, timeout=15)
-                self.logger.debug(f"Cloudscraper status: {response.status_code}")
-                self.logger.debug(f"Cloudscraper headers: {dict(response.headers)}")
+                response = await anyio.to_thread.run_sync(
+                    partial(self.cloudscraper.get, url, headers=headers, timeout=15, stream=True)
+                )
+                self.logger.debug("Cloudscraper status: %s", response.status_code)
+                self.logger.debug("Cloudscraper headers: %s", response.headers)
                 
+                if response.status_code == 304 and cached_entry is not None:
+                    response.close()
+                    await anyio.to_thread.run_sync(self.http_cache.revalidate, url, response.headers)
+                    self.logger.info("Cloudscraper revalidated cached content (304)")
+                    return FetchResult(
+                        url, cached_entry.body, validators=HTTPCache.validators(cached_entry.headers)
+                    )
                 if response.ok:
-                    # Decompress if necessary and decode
-                    content = self._decode_response_content(response)
+                    result = await anyio.to_thread.run_sync(self._read_streamed_response, url, response)
                     self.logger.info("Cloudscraper request successful")
-                    return content, ""
+                    return result
+                response.close()
+                if throttled := self._throttled(url, response.status_code, response.headers):
+                    return throttled
             except Exception as e:
-                self.logger.debug(f"Cloudscraper failed with error type: {type(e).__name__}")
-                self.logger.debug(f"Cloudscraper error details: {str(e)}")
+                self.logger.debug("Cloudscraper failed with error type: %s", type(e).__name__)
+                self.logger.debug("Cloudscraper error details: %s", e)
 
             # Fall back to regular session
             self.logger.info("Falling back to regular session request...")
-            response = self.session.get(url, headers=headers, timeout=15)
-            self.logger.debug(f"Regular session status: {response.status_code}")
-            self.logger.debug(f"Response headers: {dict(response.headers)}")
-            self.logger.debug(f"Response encoding: {response.encoding}")
+            response = await anyio.to_thread.run_sync(
+                partial(self.session.get, url, headers=headers, timeout=15, stream=True)
+            )
+            self.logger.debug("Regular session status: %s", response.status_code)
+            self.logger.debug("Response headers: %s", response.headers)
+            self.logger.debug("Response encoding: %s", response.encoding)
             
-            response.raise_for_status()
-            # Decompress if necessary and decode
-            content = self._decode_response_content(response)
-            content_length = len(content)
-            self.logger.info(f"Request successful, content length: {content_length} characters")
-            return content, ""
+            if response.status_code == 304 and cached_entry is not None:
+                response.close()
+                await anyio.to_thread.run_sync(self.http_cache.revalidate, url, response.headers)
+                self.logger.info("Request revalidated cached content (304)")
+                return FetchResult(
+                    url, cached_entry.body, validators=HTTPCache.validators(cached_entry.headers)
+                )
+            if not response.ok:
+                response.close()
+                if throttled := self._throttled(url, response.status_code, response.headers):
+                    return throttled
+                self.logger.error("Request failed with status %s", response.status_code)
+                return FetchResult(url, status=response.status_code)
+            result = await anyio.to_thread.run_sync(self._read_streamed_response, url, response)
+            self.logger.info("Request successful, content length: %s characters", len(result.content))
+            return result
         except Exception as e:
-            self.logger.error(f"Request failed with error type: {type(e).__name__}")
-            self.logger.error(f"Request error details: {str(e)}")
-            return "", ""
+            self.logger.error("Request failed with error type: %s", type(e).__name__)
+            self.logger.error("Request error details: %s", e)
+            return FetchResult(url)
 
-    async def _fetch_with_requests_html(self, url: str) -> Tuple[str, str]:
+    async def _fetch_with_requests_html(self, url: str) -> FetchResult:
         self.logger.info("Starting requests-html fetch process...")
         try:
-            headers = {
-                'User-Agent': self._get_random_user_agent(),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
+            headers = dict(self._browser_profile(url).headers)
             
             response = await self.html_session.get(url, headers=headers, timeout=30)
-            self.logger.debug(f"Initial response status: {response.status_code}")
+            self.logger.debug("Initial response status: %s", response.status_code)
+            if not response.ok:
+                self.logger.error("requests-html fetch failed with status %s", response.status_code)
+                return FetchResult(url, status=response.status_code)
             
-            # Decompress if necessary and decode
-            content = self._decode_response_content(response)
+            # requests has already undone the transfer coding; only the charset is left
+            content = decode_body(response.content, response.headers)
             response.html.raw_html = content.encode('utf-8', errors='replace')
             
             # Render JavaScript
@@ -157,158 +321,224 @@ class WebScraper(IScraper):
             title_text = title.text if title else ""
             
             self.logger.info("requests-html fetch successful")
-            self.logger.debug(f"Content length: {len(rendered_content)} characters")
-            return rendered_content, title_text
+            self.logger.debug("Content length: %s characters", len(rendered_content))
+            return FetchResult(url, rendered_content, title_text)
             
         except Exception as e:
-            self.logger.error(f"requests-html fetch failed: {str(e)}")
-            return "", ""
+            self.logger.error("requests-html fetch failed: %s", e)
+            return FetchResult(url)
 
-    async def _fetch_with_selenium(self, url: str) -> Tuple[str, str]:
+    async def _fetch_with_selenium(self, url: str) -> FetchResult:
         self.logger.info("Starting Selenium fetch process...")
         try:
-            # Run selenium in a separate thread using anyio
-            result = await anyio.to_thread.run_sync(
-                self._selenium_fetch,
-                url,
-                cancellable=True
-            )
-            content, title = result
+            # Run on one of the pool's warm drivers
+            content, title = await self.driver_pool.fetch(url, self._browser_profile(url, CHROMIUM_FAMILIES).user_agent)
             if content:
-                self.logger.info(f"Selenium fetch successful, title: {title}")
-                self.logger.debug(f"Content length: {len(content)} characters")
-                return result
+                self.logger.info("Selenium fetch successful, title: %s", title)
+                self.logger.debug("Content length: %s characters", len(content))
+                return FetchResult(url, content, title)
         except anyio.get_cancelled_exc_class():
             self.logger.warning("Selenium fetch cancelled")
             raise
         except Exception as e:
-            self.logger.error(f"Selenium fetch failed with error type: {type(e).__name__}")
-            self.logger.error(f"Selenium error details: {str(e)}")
-        return "", ""
-
-    def _selenium_fetch(self, url: str) -> Tuple[str, str]:
-        self.logger.debug("Configuring Selenium Chrome options...")
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(f'user-agent={self._get_random_user_agent()}')
-        options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        driver = None
-        try:
-            self.logger.debug("Initializing Chrome driver...")
-            driver = webdriver.Chrome(options=options)
-            self.logger.debug(f"Setting page load timeout: 20 seconds")
-            driver.set_page_load_timeout(20)
-            
-            self.logger.info(f"Navigating to URL: {url}")
-            driver.get(url)
-            
-            self.logger.debug("Waiting for body element...")
-            WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            content = driver.page_source
-            title = driver.title
-            self.logger.debug(f"Page loaded - Title: {title}")
-            self.logger.debug(f"Content length: {len(content)} characters")
-            return content, title
-        finally:
-            if driver:
-                self.logger.debug("Closing Chrome driver...")
-                driver.quit()
+            self.logger.error("Selenium fetch failed with error type: %s", type(e).__name__)
+            self.logger.error("Selenium error details: %s", e)
+        return FetchResult(url)
 
-    async def _fetch_with_playwright(self, url: str) -> Tuple[str, str]:
+    async def _fetch_with_playwright(self, url: str) -> FetchResult:
         self.logger.info("Starting Playwright fetch process...")
-        async with self._browser_context() as browser:
-            try:
-                context = await browser.new_context(
-                    user_agent=self._get_random_user_agent()
-                )
-                page = await context.new_page()
-                self.logger.info(f"Navigating to URL: {url}")
-                
+        try:
+            async with self.browser_pool.page(
+                user_agent=self._browser_profile(url, CHROMIUM_FAMILIES).user_agent
+            ) as page:
+                self.logger.info("Navigating to URL: %s", url)
+
                 response = await page.goto(url, wait_until='networkidle')
                 if not response:
                     self.logger.error("Failed to get response from page")
-                    return "", ""
-                
+                    return FetchResult(url)
+
                 content = await page.content()
                 # Ensure content is a string
                 content = str(content)
                 title = await page.title()
-                
-                self.logger.info(f"Page loaded successfully - Title: {title}")
-                self.logger.debug(f"Content length: {len(content)} characters")
-                return content, title
-                
-            except Exception as e:
-                self.logger.error(f"Playwright error type: {type(e).__name__}")
-                self.logger.error(f"Playwright error details: {str(e)}")
-                return "", ""
-
-    def _decode_response_content(self, response):
-        """Decompress and decode response content if necessary."""
-        content = response.content
-        if response.headers.get('Content-Encoding') == 'gzip':
-            import gzip
-            content = gzip.decompress(content)
-        elif response.headers.get('Content-Encoding') == 'deflate':
-            import zlib
-            content = zlib.decompress(content, -zlib.MAX_WBITS)
-        return content.decode(response.apparent_encoding or 'utf-8', errors='replace')
+
+                self.logger.info("Page loaded successfully - Title: %s", title)
+                self.logger.debug("Content length: %s characters", len(content))
+                return FetchResult(url, content, title)
+
+        except anyio.get_cancelled_exc_class():
+            raise
+        except Exception as e:
+            self.logger.error("Playwright error type: %s", type(e).__name__)
+            self.logger.error("Playwright error details: %s", e)
+            return FetchResult(url)
+
+    def _fetch_tiers(self, url: str) -> List[FetchTier]:
+        tiers = [
+            (self._fetch_with_aiohttp, "aiohttp", HTTP_SETTINGS['timeout']),
+            (self._fetch_with_requests, "Requests", 5),
+            (self._fetch_with_requests_html, "Requests-HTML", 10),
+            (self._fetch_with_selenium, "Selenium", 15),
+            (self._fetch_with_playwright, "Playwright", 20)
+        ]
+        if self.strategy_store is None:
+            return tiers
+
+        # Reorder (and prune) the tiers using what was learned for this domain
+        by_name = {tier[1]: tier for tier in tiers}
+        order = self.strategy_store.order_tiers(url, list(by_name))
+        return [by_name[name] for name in order]
+
+    def _record_tier(self, url: str, name: str, success: Optional[bool], elapsed: float,
+                     page: Optional[FetchResult] = None) -> None:
+        """
+        Report a tier outcome to the strategy store and metrics; None means it
+        was cancelled. HTTP error responses (a dead link, a server error, rate
+        limiting) say nothing about the tier and are left out of the store, so
+        they never prune cheap tiers or promote browser tiers for the domain.
+        Bot challenges (403, or 503 without Retry-After) do count: another tier
+        may get past them.
+        """
+        if page is not None and page.http_error and (page.throttled or page.status not in _CHALLENGE_STATUSES):
+            outcome = 'throttled' if page.throttled else 'http_error'
+            self.metrics.observe('fetch_tier_seconds', elapsed, tier=name, outcome=outcome)
+            return
+        outcome = 'cancelled' if success is None else 'success' if success else 'failure'
+        self.metrics.observe('fetch_tier_seconds', elapsed, tier=name, outcome=outcome)
+        if success is False:
+            self.metrics.increment('fetch_tier_failures_total', tier=name)
+        if self.strategy_store is not None and success is not None:
+            self.strategy_store.record(url, name, success, elapsed)
 
     async def fetch_content(self, url: str) -> Tuple[str, str]:
-        self.logger.info(f"Starting fetch for URL: {url}")
-        
+        result = await self.fetch_detailed(url)
+        return result.content, result.title
+
+    async def fetch_detailed(self, url: str) -> FetchResult:
+        self.logger.info("Starting fetch for URL: %s", url)
+
         # Check cache first
         cache_key = f"content_{url}"
         if cache_key in self.cache:
+            self.metrics.increment('cache_events_total', cache='memory', event='hit')
             self.logger.info("Returning cached content")
-            return self.cache[cache_key]
+            content, title = self.cache[cache_key]
+            return FetchResult(url, content, title, tier="cache")
+        self.metrics.increment('cache_events_total', cache='memory', event='miss')
 
-        fetch_methods = [
-            (self._fetch_with_requests, "Requests", 5),  # timeout in seconds
-            (self._fetch_with_requests_html, "Requests-HTML", 10),
-            (self._fetch_with_selenium, "Selenium", 15),
-            (self._fetch_with_playwright, "Playwright", 20)
-        ]
+        entry = await anyio.to_thread.run_sync(self.http_cache.fresh, url) if self.http_cache is not None else None
+        if entry is not None:
+            self.logger.info("Returning fresh content from HTTP cache")
+            return FetchResult(
+                url, entry.body, "", tier="http-cache", validators=HTTPCache.validators(entry.headers)
+            )
+
+        tiers = self._fetch_tiers(url)
+        if self.fetch_mode == 'hedged':
+            result = await self._fetch_hedged(url, tiers)
+        else:
+            result = await self._fetch_sequential(url, tiers)
+
+        timings = ", ".join(f"{name}={seconds:.2f}s" for name, seconds in result.timings.items())
+        if result.ok:
+            # Cache successful result
+            self.cache[cache_key] = (result.content, result.title)
+            self.logger.info("Fetched with %s (%s)", result.tier, timings)
+        else:
+            self.logger.error("All fetch methods failed (%s)", timings)
+        return result
+
+    async def _fetch_sequential(self, url: str, tiers: List[FetchTier]) -> FetchResult:
+        """Try each tier in turn until one returns content."""
+        result = FetchResult(url)
+        for method, name, timeout in tiers:
+            started = time.perf_counter()
+            success = None
+            page = FetchResult(url)
+            try:
+                with anyio.move_on_after(timeout):
+                    page = await method(url)
+                success = page.ok
+                if success:
+                    result.adopt(page, name)
+                    return result
+                if page.throttled:
+                    # Heavier tiers would hit the same rate limit
+                    result.status, result.retry_after = page.status, page.retry_after
+                    return result
+            except Exception as e:
+                success = False
+                self.logger.error("%s failed: %s", name, e)
+            finally:
+                result.timings[name] = time.perf_counter() - started
+                self._record_tier(url, name, success, result.timings[name], page)
+        return result
+
+    async def _fetch_hedged(self, url: str, tiers: List[FetchTier]) -> FetchResult:
+        """
+        Race the tiers: start the cheapest one, and start the next whenever
+        ``hedge_delay`` passes without content or every running tier has
+        failed. The first tier to return content wins; the rest are cancelled.
+        """
+        result = FetchResult(url)
+        state = {'running': 0, 'changed': anyio.Event()}
+
+        async def run_tier(method: Callable, name: str, timeout: float) -> None:
+            started = time.perf_counter()
+            success = None
+            page = FetchResult(url)
+            try:
+                with anyio.move_on_after(timeout):
+                    page = await method(url)
+                success = page.ok
+                if success and not result.ok:
+                    result.adopt(page, name)
+                    tg.cancel_scope.cancel()  # Stop the losing tiers
+                elif page.throttled and not result.ok:
+                    result.status, result.retry_after = page.status, page.retry_after
+                    tg.cancel_scope.cancel()  # The others would be refused as well
+            except Exception as e:
+                success = False
+                self.logger.error("%s failed: %s", name, e)
+            finally:
+                result.timings[name] = time.perf_counter() - started
+                self._record_tier(url, name, success, result.timings[name], page)
+                state['running'] -= 1
+                state['changed'].set()
 
         async with anyio.create_task_group() as tg:
-            for method, name, timeout in fetch_methods:
-                try:
-                    with anyio.move_on_after(timeout):
-                        content, title = await method(url)
-                        if content:
-                            # Cache successful result
-                            self.cache[cache_key] = (content, title)
-                            tg.cancel_scope.cancel()  # Stop other tasks
-                            return content, title
-                except Exception as e:
-                    self.logger.error(f"{name} failed: {str(e)}")
-                    continue
-
-        self.logger.error("All fetch methods failed")
-        return "", ""
+            for index, (method, name, timeout) in enumerate(tiers):
+                state['running'] += 1
+                tg.start_soon(run_tier, method, name, timeout)
+                if index == len(tiers) - 1:
+                    break
+                with anyio.move_on_after(self.hedge_delay):
+                    while state['running'] > 0:
+                        state['changed'] = anyio.Event()
+                        await state['changed'].wait()
+        return result
 
     async def close(self):
         """Cleanup resources asynchronously"""
         self.logger.info("Cleaning up WebScraper resources...")
-        self.process_pool.close()
-        self.process_pool.join()
-        self.executor.shutdown(wait=True)
-        await self.html_session.close()
-        self.session.close()
+        if self._is_started('html_session'):
+            await self.html_session.close()
+        if self._http_session is not None:
+            await self._http_session.close()
+        if self._is_started('browser_pool'):
+            await self.browser_pool.close()
+        if self._is_started('driver_pool'):
+            await anyio.to_thread.run_sync(self.driver_pool.close)
+        if self.strategy_store is not None:
+            self.strategy_store.save()
+        if self.http_cache is not None:
+            self.logger.info("HTTP cache stats: %s", self.http_cache.stats())
+            self.http_cache.close()
+        if self._is_started('user_agents'):
+            await anyio.to_thread.run_sync(self.user_agents.close)
+        if self._is_started('session'):
+            self.session.close()
+        if self._is_started('cloudscraper'):
+            self.cloudscraper.close()
         self.logger.info("WebScraper cleanup completed")
-
-    def __del__(self):
-        """Fallback cleanup"""
-        try:
-            self.process_pool.close()
-            self.process_pool.join()
-            self.executor.shutdown(wait=False)
-        except:
-            pass
\ No newline at end of file
@@ -100,10 +100,10 @@ class MarkdownViewer(QMainWindow):
         content, title = await self.scraper.fetch_content(url)
         
         # Update HTML preview first
-        self.html_preview.set_content(content)
+        await self.html_preview.set_content(content)
         
         self._update_status("Converting to markdown...")
-        markdown = self.converter.convert_to_markdown(content)
+        markdown = await self.converter.convert_to_markdown_async(content)
         
         self._update_status("Updating display...")
         self.markdown_widget.set_content(markdown, title)
@@ -115,12 +115,10 @@ class MarkdownViewer(QMainWindow):
         """Enable or disable UI elements."""
         self.url_widget.set_enabled(enabled)
         self.action_buttons.setEnabled(enabled)
-        QApplication.processEvents()
 
     def _update_status(self, message: str, timeout: int = 0) -> None:
         """Update status bar with message."""
         self.statusBar().showMessage(message, timeout)
-        QApplication.processEvents()
 
     def save_markdown(self):
         content = self.markdown_widget.get_content()
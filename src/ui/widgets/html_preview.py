@@ -1,34 +1,85 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextBrowser
+import anyio
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextBrowser
 from PySide6.QtCore import Qt
+from qasync import asyncSlot
+from src.services.preview import sanitize_html
 
 class HTMLPreviewWidget(QWidget):
+    """
+    Shows a sanitized rendering of the fetched page.
+
+    Pages are cleaned in a worker thread before they reach QTextBrowser;
+    pages above the size threshold are previewed truncated, with a button
+    to render the whole page on demand.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._html_content = ""
+        self._generation = 0  # Bumped per set_content so stale results are dropped
         self._init_ui()
-        
+
     def _init_ui(self):
         layout = QVBoxLayout(self)
-        
+
         # Header label
         header = QLabel("HTML Preview")
         header.setAlignment(Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(header)
-        
+
         # Text browser for HTML content
         self.text_browser = QTextBrowser()
         self.text_browser.setMinimumHeight(200)
         self.text_browser.setOpenExternalLinks(True)
         layout.addWidget(self.text_browser)
-        
+
+        # Shown when the preview was truncated
+        truncated_bar = QHBoxLayout()
+        self.truncated_label = QLabel()
+        self.load_full_button = QPushButton("Load full preview")
+        self.load_full_button.clicked.connect(self.load_full_content)
+        truncated_bar.addWidget(self.truncated_label)
+        truncated_bar.addStretch()
+        truncated_bar.addWidget(self.load_full_button)
+        layout.addLayout(truncated_bar)
+
         self.clear_content()
-        
-    def set_content(self, html_content: str):
+
+    async def set_content(self, html_content: str):
         """Set the HTML content to display."""
+        self._html_content = html_content
         if html_content:
-            self.text_browser.setHtml(html_content)
+            await self._render(html_content)
         else:
             self.clear_content()
-            
+
+    @asyncSlot()
+    async def load_full_content(self):
+        """Render the whole page, ignoring the size threshold."""
+        if self._html_content:
+            self.load_full_button.setEnabled(False)
+            await self._render(self._html_content, limit=None)
+
+    async def _render(self, html_content: str, **options):
+        self._generation += 1
+        generation = self._generation
+        self.text_browser.setHtml("<center><p>Preparing preview...</p></center>")
+        preview = await anyio.to_thread.run_sync(lambda: sanitize_html(html_content, **options))
+        if generation != self._generation:
+            return  # Newer content arrived while this one was being cleaned
+        self.text_browser.setHtml(preview.text)
+        self._set_truncated(preview.truncated, preview.shown_size, preview.original_size)
+
+    def _set_truncated(self, truncated: bool, shown: int = 0, total: int = 0):
+        self.truncated_label.setText(
+            f"Preview truncated to {shown // 1024} KB of {total // 1024} KB" if truncated else ""
+        )
+        self.truncated_label.setVisible(truncated)
+        self.load_full_button.setVisible(truncated)
+        self.load_full_button.setEnabled(truncated)
+
     def clear_content(self):
         """Clear the HTML preview."""
-        self.text_browser.setHtml("<center><p>No content to preview</p></center>")
\ No newline at end of file
+        self._generation += 1
+        self._set_truncated(False)
+        self.text_browser.setHtml("<center><p>No content to preview</p></center>")
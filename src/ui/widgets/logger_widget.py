@@ -1,11 +1,28 @@
-from PySide6.QtWidgets import QWidget, QTextEdit, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
+import threading
+from collections import deque
+from PySide6.QtWidgets import QWidget, QPlainTextEdit, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, QTimer, Signal
+from src.config import LOG_WIDGET_SETTINGS
 from src.services.logger import LogObserver, LoggerService
 
 class LogWidget(QWidget):
+    """
+    Log view fed from the logger's delivery thread.
+
+    Messages are buffered in a ring buffer and appended in batches by a
+    single-shot timer on the GUI thread, so a burst of records costs one
+    repaint; the document keeps at most ``max_lines`` lines.
+    """
+    _flush_requested = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._max_lines = LOG_WIDGET_SETTINGS['max_lines']
+        self._pending = deque(maxlen=self._max_lines)
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
         self._setup_ui()
+        self._setup_flush_timer()
         self._register_logger()
 
     def _setup_ui(self):
@@ -18,12 +35,13 @@ class LogWidget(QWidget):
         layout.addWidget(title_label)
 
         # Add log text area
-        self._log_text = QTextEdit()
+        self._log_text = QPlainTextEdit()
         self._log_text.setReadOnly(True)
+        self._log_text.setMaximumBlockCount(self._max_lines)
         
         # Set monospace font for better icon support
         self._log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-family: "SF Mono", Menlo, Monaco, "Courier New", monospace;
                 font-size: 12px;
                 line-height: 1.4;
@@ -37,8 +55,34 @@ class LogWidget(QWidget):
         logger = LoggerService()
         logger.add_observer(self)
 
+    def _setup_flush_timer(self):
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_WIDGET_SETTINGS['flush_interval_ms'])
+        self._flush_timer.timeout.connect(self._flush)
+        # Emitted from the logger thread; the queued connection starts the timer on the GUI thread
+        self._flush_requested.connect(self._flush_timer.start, Qt.QueuedConnection)
+
     def on_log_message(self, level: str, message: str, timestamp: str):
-        self._log_text.append(f"[{timestamp}] {level}: {message}")
-        self._log_text.verticalScrollBar().setValue(
-            self._log_text.verticalScrollBar().maximum()
-        )
\ No newline at end of file
+        # Called on the logger's delivery thread: buffer, and wake the GUI once per batch
+        with self._pending_lock:
+            self._pending.append(f"[{timestamp}] {level}: {message}")
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._flush_requested.emit()
+
+    def _flush(self):
+        with self._pending_lock:
+            lines = list(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+        if not lines:
+            return
+
+        # Follow the output only if the user hasn't scrolled up
+        scrollbar = self._log_text.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        self._log_text.appendPlainText("\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
\ No newline at end of file
@@ -1,34 +1,65 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QLabel
-from typing import Optional
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QLabel, QPushButton
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
+from typing import Iterator, Optional
+from src.config import PREVIEW_SETTINGS
+from src.services.preview import truncate, iter_chunks
 
 class MarkdownDisplayWidget(QWidget):
-    """Widget for displaying and formatting markdown content."""
+    """
+    Widget for displaying and formatting markdown content.
+
+    The text is laid out in chunks across event loop turns, and documents
+    above the size threshold are shown truncated until the full text is
+    requested. ``get_content`` always returns the complete Markdown.
+    """
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.title: str = ""
+        self._content: str = ""
+        self._chunks: Optional[Iterator[str]] = None
         self._init_ui()
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
-        
+
         self._setup_header()
         self._setup_editor()
-        
+        self._setup_truncation_bar()
+        self._setup_chunk_timer()
+
     def _setup_header(self) -> None:
         self.header_label = QLabel("Markdown Preview:")
         self.layout().addWidget(self.header_label)
-        
+
     def _setup_editor(self) -> None:
-        self.text_edit = QTextEdit()
+        # QPlainTextEdit only lays out the blocks that are visible
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
         self._apply_editor_style()
         self.layout().addWidget(self.text_edit)
-        
+
+    def _setup_truncation_bar(self) -> None:
+        bar = QHBoxLayout()
+        self.truncated_label = QLabel()
+        self.show_full_button = QPushButton("Show full document")
+        self.show_full_button.clicked.connect(self.show_full_content)
+        bar.addWidget(self.truncated_label)
+        bar.addStretch()
+        bar.addWidget(self.show_full_button)
+        self.layout().addLayout(bar)
+        self._set_truncated(False)
+
+    def _setup_chunk_timer(self) -> None:
+        self._chunk_timer = QTimer(self)
+        self._chunk_timer.setInterval(0)  # One chunk per event loop turn
+        self._chunk_timer.timeout.connect(self._append_next_chunk)
+
     def _apply_editor_style(self) -> None:
         self.text_edit.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 border: none;
                 font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
                 font-size: 14px;
@@ -39,28 +70,58 @@ class MarkdownDisplayWidget(QWidget):
     def set_content(self, content: str, title: str) -> None:
         """
         Set the markdown content and title.
-        
+
         Args:
             content (str): The markdown content to display
             title (str): The title of the content
         """
         self.title = title
-        self.text_edit.setText(content)
+        self._content = content
+        preview = truncate(content, PREVIEW_SETTINGS['max_markdown_chars'])
+        self._set_truncated(preview.truncated, preview.shown_size, preview.original_size)
+        self._load(preview.text)
+
+    def show_full_content(self) -> None:
+        """Display the whole document, ignoring the size threshold."""
+        self._set_truncated(False)
+        self._load(self._content)
+
+    def _load(self, text: str) -> None:
+        self._chunk_timer.stop()
+        self._chunks = iter_chunks(text)
+        self.text_edit.setPlainText(next(self._chunks, ""))
+        self._chunk_timer.start()
+
+    def _append_next_chunk(self) -> None:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._chunk_timer.stop()
+            return
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+
+    def _set_truncated(self, truncated: bool, shown: int = 0, total: int = 0) -> None:
+        self.truncated_label.setText(
+            f"Showing {shown // 1024} KB of {total // 1024} KB" if truncated else ""
+        )
+        self.truncated_label.setVisible(truncated)
+        self.show_full_button.setVisible(truncated)
 
     def get_content(self) -> str:
         """
         Get the current markdown content.
-        
+
         Returns:
-            str: The current markdown text
+            str: The complete markdown text, including any part not displayed
         """
-        return self.text_edit.toPlainText()
+        return self._content
 
     def get_title(self) -> str:
         """
         Get the current content title.
-        
+
         Returns:
             str: The current title
         """
-        return self.title
\ No newline at end of file
+        return self.title
@@ -0,0 +1,11 @@
+import re
+
+
+def slugify(text):
+    """
+    Convert text to a slug format.
+    """
+    text = text.lower()
+    text = re.sub(r'[^\w\s-]', '', text)  # Remove non-alphanumeric characters
+    text = re.sub(r'\s+', '-', text).strip('-')  # Replace spaces with dashes
+    return text